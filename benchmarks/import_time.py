@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+""" Measures the time taken to import ``Flask-Velox`` modules and which
+optional integrations each import pulls in. Each module is imported in a
+fresh interpreter after ``flask`` has been imported, so the reported time is
+only the cost added by ``Flask-Velox`` and anything it imports.
+
+Example
+-------
+
+.. code-block:: sh
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget 50 flask_velox.views.template
+
+When ``--budget`` is given the script exits with a non zero status if any
+module takes longer than the budget, in milliseconds, to import.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+
+#: Modules measured when none are passed on the command line
+MODULES = [
+    'flask_velox',
+    'flask_velox.formatters',
+    'flask_velox.views.template',
+    'flask_velox.views.forms',
+    'flask_velox.views.sqla.read',
+    'flask_velox.views.sqla.forms',
+    'flask_velox.admin.views.template',
+    'flask_velox.admin.views.sqla.read',
+    'flask_velox.admin.views.sqla.forms',
+]
+
+#: Optional integrations reported if loaded by an import
+OPTIONAL = [
+    'flask_admin',
+    'flask_sqlalchemy',
+    'flask_wtf',
+    'pytz',
+    'sqlalchemy',
+    'wtforms',
+]
+
+PROBE = '''
+import json
+import sys
+import time
+
+import flask
+
+start = time.time()
+__import__(sys.argv[1])
+elapsed = (time.time() - start) * 1000
+
+print(json.dumps({
+    'ms': elapsed,
+    'loaded': [name for name in sys.argv[2:] if name in sys.modules]}))
+'''
+
+
+def measure(module, repeat):
+    """ Import a module in a fresh interpreter ``repeat`` times.
+
+    Arguments
+    ---------
+    module : str
+        Dotted module path to import
+    repeat : int
+        Number of fresh interpreters to import the module in
+
+    Returns
+    -------
+    tuple
+        Fastest import time in milliseconds, optional modules loaded
+    """
+
+    best, loaded = None, []
+
+    for i in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', PROBE, module] + OPTIONAL)
+        result = json.loads(output.decode('utf-8'))
+        if best is None or result['ms'] < best:
+            best = result['ms']
+        loaded = result['loaded']
+
+    return best, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n')[0].strip())
+    parser.add_argument('modules', nargs='*', default=MODULES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=None)
+    args = parser.parse_args()
+
+    over = []
+
+    for module in args.modules:
+        ms, loaded = measure(module, args.repeat)
+        print('{0:<40} {1:>8.1f}ms  {2}'.format(
+            module,
+            ms,
+            ', '.join(loaded) or '-'))
+        if args.budget is not None and ms > args.budget:
+            over.append(module)
+
+    if over:
+        print('Over {0}ms budget: {1}'.format(args.budget, ', '.join(over)))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
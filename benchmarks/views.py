@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+
+""" Micro benchmarks for ``Flask-Velox`` view hot paths against in memory and
+file backed SQLite databases.
+
+Note
+----
+The following packages must be installed:
+
+* Flask-SQLAlchemy
+* Flask-WTF
+
+Example
+-------
+
+.. code-block:: sh
+
+    python benchmarks/views.py
+    python benchmarks/views.py --rows 10000 --iterations 20 --db file
+    python benchmarks/views.py --json before.json table_render object
+
+Each benchmark reports the mean and fastest time per iteration. On Python 3
+the peak memory allocated and number of allocated blocks during a single
+iteration are also reported using ``tracemalloc``. Use ``--json`` to save
+results so changes to the mixins can be compared over time.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from flask_velox.fields import UploadFileField
+from flask_velox.mixins.context import ContextMixin
+from flask_velox.views.forms import MultiFormView
+from flask_velox.views.sqla.delete import MultiDeleteObjectView
+from flask_velox.views.sqla.forms import CreateModelView
+from flask_velox.views.sqla.read import (
+    ModelListView,
+    ObjectView,
+    TableModelView)
+from flask_wtf import Form
+from jinja2 import DictLoader
+from wtforms import TextField
+
+try:
+    from io import BytesIO
+except ImportError:  # pragma: no cover
+    from StringIO import StringIO as BytesIO
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+TEMPLATES = {
+    'list.html': (
+        '{% for object in objects %}{{ object.name }}{% endfor %}'),
+    'object.html': '{{ object.name }}',
+    'table.html': (
+        '<table><tr>{% for column in columns %}'
+        '<th>{{ column_name(column) }}</th>{% endfor %}</tr>'
+        '{% for object in objects %}<tr>{% for column in columns %}'
+        '<td>{{ format_value(column, object) }}</td>{% endfor %}</tr>'
+        '{% endfor %}</table>'),
+    'form.html': (
+        '<form>{% for field in form %}{{ field() }}{% endfor %}</form>'),
+    'forms.html': (
+        '{% for prefix, values in forms.items() %}'
+        '<form>{% for field in values[1] %}{{ field() }}{% endfor %}</form>'
+        '{% endfor %}'),
+    'delete.html': '{% for object in objects %}{{ object }}{% endfor %}',
+}
+
+STATUSES = ['draft', 'published', 'archived']
+
+
+def create_app(uri, media_root):
+    """ Create an application with a model, forms and views to benchmark.
+
+    Arguments
+    ---------
+    uri : str
+        SQLAlchemy database uri
+    media_root : str
+        Directory uploaded files are written to
+
+    Returns
+    -------
+    tuple
+        Flask application, SQLAlchemy object, Item model
+    """
+
+    app = Flask(__name__)
+    app.config.update({
+        'SECRET_KEY': 'benchmark',
+        'SQLALCHEMY_DATABASE_URI': uri,
+        'WTF_CSRF_ENABLED': False,
+        'MEDIA_ROOT': media_root,
+    })
+    app.jinja_loader = DictLoader(TEMPLATES)
+
+    db = SQLAlchemy(app)
+
+    class Item(db.Model):
+        id = db.Column(db.Integer, primary_key=True)
+        name = db.Column(db.Unicode(128))
+        status = db.Column(db.Unicode(32), index=True)
+        attachment = db.Column(db.Unicode(256))
+
+        def __str__(self):
+            return self.name
+
+    class ItemForm(Form):
+        name = TextField()
+        status = TextField()
+
+    class ListView(ModelListView):
+        template = 'list.html'
+        session = db.session
+        model = Item
+        paginate = False
+
+    class PaginatedListView(ListView):
+        paginate = True
+
+    class TableView(TableModelView):
+        template = 'table.html'
+        session = db.session
+        model = Item
+        columns = ['id', 'name', 'status']
+        num_per_page = 200
+
+    class ItemView(ObjectView):
+        template = 'object.html'
+        session = db.session
+        model = Item
+
+    class CreateView(CreateModelView):
+        template = 'form.html'
+        session = db.session
+        model = Item
+        form = ItemForm
+        redirect_url_rule = 'table'
+
+    class MultiView(MultiFormView):
+        template = 'forms.html'
+        forms = [('Item {0}'.format(i), ItemForm) for i in range(8)]
+        redirect_url_rule = 'table'
+
+    class DeleteView(MultiDeleteObjectView):
+        template = 'delete.html'
+        session = db.session
+        model = Item
+        redirect_url_rule = 'table'
+
+    app.add_url_rule('/list', view_func=ListView.as_view('list'))
+    app.add_url_rule('/table', view_func=TableView.as_view('table'))
+    app.add_url_rule('/object/<int:id>', view_func=ItemView.as_view('object'))
+    app.add_url_rule(
+        '/create',
+        view_func=CreateView.as_view('create'),
+        methods=['GET', 'POST'])
+    app.add_url_rule(
+        '/multi',
+        view_func=MultiView.as_view('multi'),
+        methods=['GET', 'POST'])
+    app.add_url_rule('/delete', view_func=DeleteView.as_view('delete'))
+
+    app.extensions['benchmark'] = {
+        'list': ListView,
+        'paginated_list': PaginatedListView,
+        'object': ItemView,
+    }
+
+    return app, db, Item
+
+
+def seed(db, model, rows):
+    """ Insert ``rows`` records into the model table.
+    """
+
+    db.session.add_all([
+        model(
+            name=u'Item {0}'.format(i),
+            status=STATUSES[i % len(STATUSES)])
+        for i in range(rows)])
+    db.session.commit()
+
+
+def build(app, db, model, rows):
+    """ Returns a list of benchmarks as tuples of name, setup and function.
+    Setup callables are run before each iteration and are not timed.
+    """
+
+    client = app.test_client()
+    views = app.extensions['benchmark']
+    media_root = app.config['MEDIA_ROOT']
+    created = []
+
+    class Context(ContextMixin):
+        context = dict(('key{0}'.format(i), i) for i in range(50))
+
+    class UploadForm(Form):
+        attachment = UploadFileField()
+
+    def noop():
+        pass
+
+    def context_merge():
+        view = Context()
+        for i in range(50):
+            view.merge_context({'extra{0}'.format(i): i})
+
+    def get_objects(name):
+        def run():
+            with app.test_request_context('/list?page=2'):
+                view = views[name].__new__(views[name])
+                view.get_objects()
+        return run
+
+    def get_object():
+        with app.test_request_context('/object/{0}'.format(rows // 2)):
+            view = views['object'].__new__(views['object'])
+            view.get_object()
+
+    def table_render():
+        client.get('/table')
+
+    def form_get():
+        client.get('/create')
+
+    def form_post():
+        client.post('/create', data={'name': u'Created', 'status': u'draft'})
+
+    def remove_created():
+        model.query.filter_by(name=u'Created').delete()
+        db.session.commit()
+
+    def multi_form_get():
+        client.get('/multi')
+
+    def multi_form_post():
+        client.post('/multi', data={'form': 'form4', 'form4-name': u'Multi'})
+
+    def seed_delete():
+        seed(db, model, 100)
+        del created[:]
+        created.extend(
+            o.id for o in model.query.order_by(model.id.desc()).limit(100))
+
+    def multi_delete():
+        client.post('/delete?confirm=1', data={'objects': created})
+
+    def populate_obj():
+        data = {'attachment': (BytesIO(b'x' * 1024), 'upload.txt')}
+        with app.test_request_context('/upload', method='POST', data=data):
+            form = UploadForm()
+            form.attachment.populate_obj(model(), 'attachment')
+
+    def clean_media():
+        shutil.rmtree(media_root, ignore_errors=True)
+
+    return [
+        ('context_merge', noop, context_merge),
+        ('get_objects', noop, get_objects('list')),
+        ('get_objects_paginated', noop, get_objects('paginated_list')),
+        ('table_render', noop, table_render),
+        ('object', noop, get_object),
+        ('form_get', noop, form_get),
+        ('form_post', remove_created, form_post),
+        ('multi_form_get', noop, multi_form_get),
+        ('multi_form_post', noop, multi_form_post),
+        ('multi_delete', seed_delete, multi_delete),
+        ('upload_populate_obj', clean_media, populate_obj),
+    ]
+
+
+def run(setup, func, iterations):
+    """ Time ``func`` over a number of iterations and measure allocations for
+    a single iteration if ``tracemalloc`` is available.
+
+    Returns
+    -------
+    dict
+        Mean and fastest times in milliseconds, peak memory in KiB and
+        allocated blocks
+    """
+
+    # Warm up, the first call compiles templates and fills caches
+    setup()
+    func()
+
+    times = []
+    for i in range(iterations):
+        setup()
+        start = time.time()
+        func()
+        times.append((time.time() - start) * 1000)
+
+    result = {
+        'mean_ms': sum(times) / len(times),
+        'min_ms': min(times),
+        'peak_kib': None,
+        'blocks': None,
+    }
+
+    if tracemalloc is not None:
+        setup()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        func()
+        after = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        stats = after.compare_to(before, 'filename')
+        result['peak_kib'] = peak / 1024.0
+        result['blocks'] = sum(max(s.count_diff, 0) for s in stats)
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n')[0].strip())
+    parser.add_argument('benchmarks', nargs='*')
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument(
+        '--db',
+        choices=['memory', 'file', 'both'],
+        default='both')
+    parser.add_argument('--json', dest='output', default=None)
+    args = parser.parse_args()
+
+    databases = ['memory', 'file'] if args.db == 'both' else [args.db]
+    results = []
+
+    print('{0:<24} {1:<7} {2:>10} {3:>10} {4:>10} {5:>8}'.format(
+        'benchmark', 'db', 'mean ms', 'min ms', 'peak KiB', 'blocks'))
+
+    for database in databases:
+        tmp = tempfile.mkdtemp()
+        if database == 'memory':
+            uri = 'sqlite://'
+        else:
+            uri = 'sqlite:///' + os.path.join(tmp, 'benchmark.db')
+
+        app, db, model = create_app(uri, os.path.join(tmp, 'media'))
+
+        with app.app_context():
+            db.create_all()
+            seed(db, model, args.rows)
+
+            for name, setup, func in build(app, db, model, args.rows):
+                if args.benchmarks and name not in args.benchmarks:
+                    continue
+                result = run(setup, func, args.iterations)
+                result.update({
+                    'benchmark': name,
+                    'db': database,
+                    'rows': args.rows})
+                results.append(result)
+                print('{0:<24} {1:<7} {2:>10.3f} {3:>10.3f} {4:>10} '
+                      '{5:>8}'.format(
+                          name,
+                          database,
+                          result['mean_ms'],
+                          result['min_ms'],
+                          '-' if result['peak_kib'] is None
+                          else '{0:.1f}'.format(result['peak_kib']),
+                          '-' if result['blocks'] is None
+                          else result['blocks']))
+
+            db.session.remove()
+
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
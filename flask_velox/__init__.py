@@ -1,9 +1,46 @@
 # -*- coding: utf-8 -*-
 
 """ Initialise Flask Extenstion
+
+Configuration
+-------------
+
+The following application configuration values are supported:
+
+* ``VELOX_BYTECODE_CACHE_DIR``: Directory to store compiled template
+  bytecode in, when set a file system bytecode cache is shared between all
+  processes using the same directory, for example gunicorn workers
+* ``VELOX_PRECOMPILE_TEMPLATES``: Compile all ``Flask-Velox`` templates when
+  the extension is initialised, defaults to ``False``
+* ``VELOX_TEMPLATES``: List of extra application templates to compile when
+  ``VELOX_PRECOMPILE_TEMPLATES`` is ``True``
+* ``VELOX_PRELOAD``: Call :py:meth:`Velox.preload` at the end of ``init_app``,
+  defaults to ``False``
+* ``VELOX_SERVER_TIMING``: Add a ``Server-Timing`` header to responses timing
+  view phases, see :py:mod:`flask_velox.instrumentation`
+* ``VELOX_METRICS``: Record request metrics and expose them in the Prometheus
+  text format, see :py:mod:`flask_velox.metrics`
+* ``VELOX_TRACING``: Wrap view phases in OpenTelemetry spans, see
+  :py:mod:`flask_velox.tracing`
+* ``VELOX_SLOW_QUERY_THRESHOLD``: Log statements fetching objects which take
+  longer than this many milliseconds, see :py:mod:`flask_velox.slowquery`
+* ``VELOX_PROFILE_DIR``: Profile requests carrying a signed
+  ``X-Velox-Profile`` header, see :py:mod:`flask_velox.profiling`
+* ``VELOX_ALLOCATIONS``: Trace memory allocations of views with
+  ``tracemalloc``, see :py:mod:`flask_velox.allocations`
+* ``VELOX_GROUP_COMMIT_WINDOW``: Seconds create views with ``group_commit``
+  wait to batch objects, see :py:mod:`flask_velox.groupcommit`
+* ``VELOX_CHOICES_TTL``: Seconds choices of views with ``cache_choices`` are
+  cached for, see :py:mod:`flask_velox.choices`
 """
 
+import gc
+
 from flask import Blueprint
+from flask_velox import instrumentation
+from flask_velox.mixins.http import RedirectMixin
+from flask_velox.mixins.template import TemplateMixin
+from jinja2 import FileSystemBytecodeCache, TemplateNotFound
 
 
 class Velox(object):
@@ -24,3 +61,185 @@ class Velox(object):
             template_folder='templates')
 
         app.register_blueprint(velox)
+
+        self.init_bytecode_cache(app)
+        self.init_cli(app)
+
+        instrumentation.init_app(app)
+
+        if app.config.get('VELOX_PRECOMPILE_TEMPLATES', False):
+            self.precompile_templates(app)
+
+        if app.config.get('VELOX_PRELOAD', False):
+            self.preload(app)
+
+    def init_bytecode_cache(self, app):
+        """ Sets a file system bytecode cache on the applications Jinja
+        environment if ``VELOX_BYTECODE_CACHE_DIR`` is defined. An existing
+        bytecode cache set by the application will not be replaced.
+
+        Arguments
+        ---------
+        app : object
+            Flask application object
+        """
+
+        directory = app.config.get('VELOX_BYTECODE_CACHE_DIR')
+        if not directory or app.jinja_env.bytecode_cache is not None:
+            return
+
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory)
+
+    def init_cli(self, app):
+        """ Registers the ``velox`` command group with the ``flask`` command
+        line interface, only available with Flask 0.11+.
+
+        Arguments
+        ---------
+        app : object
+            Flask application object
+        """
+
+        if not hasattr(app, 'cli'):
+            return
+
+        from flask_velox.cli import velox
+
+        app.cli.add_command(velox)
+
+    def get_templates(self, app):
+        """ Returns the names of templates to compile at start up, this is
+        all templates provided by ``Flask-Velox`` and any templates defined
+        in ``VELOX_TEMPLATES``.
+
+        Arguments
+        ---------
+        app : object
+            Flask application object
+
+        Returns
+        -------
+        list
+            Template names
+        """
+
+        templates = app.jinja_env.list_templates(
+            filter_func=lambda name: name.startswith('velox/'))
+
+        for name in app.config.get('VELOX_TEMPLATES', []):
+            if name not in templates:
+                templates.append(name)
+
+        return templates
+
+    def precompile_templates(self, app):
+        """ Loads each template returned from :py:meth:`get_templates` into the
+        applications Jinja environment so they are compiled before the first
+        request, when a bytecode cache is configured the compiled templates
+        are written to it so other processes can load them without compiling.
+
+        Arguments
+        ---------
+        app : object
+            Flask application object
+        """
+
+        for name in self.get_templates(app):
+            app.jinja_env.get_template(name)
+
+    def get_view_classes(self, app):
+        """ Returns the ``Flask-Velox`` view classes registered with the
+        application, including those registered through ``Flask-Admin``.
+
+        Arguments
+        ---------
+        app : object
+            Flask application object
+
+        Returns
+        -------
+        list
+            View classes
+        """
+
+        classes = []
+
+        for view in app.view_functions.values():
+            kls = getattr(view, 'view_class', None)
+            if kls is None or kls in classes:
+                continue
+            if issubclass(kls, (TemplateMixin, RedirectMixin)):
+                classes.append(kls)
+
+        return classes
+
+    def preload_view(self, app, kls):
+        """ Resolves configuration for a single view class which would
+        otherwise be resolved on the first request, for example compiling
+        its template and generating column labels. Class options are already
+        resolved when the class is created, see :py:mod:`flask_velox.options`.
+
+        Arguments
+        ---------
+        app : object
+            Flask application object
+        kls : class
+            View class
+        """
+
+        options = kls._options
+
+        template = getattr(options, 'template', None)
+        if template:
+            try:
+                app.jinja_env.get_template(template)
+            except TemplateNotFound:
+                pass
+
+        model = getattr(options, 'model', None)
+        if model is None:
+            return
+
+        from flask_velox.mixins.sqla.read import TableModelMixin, column_label
+
+        if issubclass(kls, TableModelMixin):
+            for name in options.columns or []:
+                column_label(model, name)
+
+    def preload(self, app):
+        """ Resolves configuration of all registered ``Flask-Velox`` views
+        and then moves all objects into the garbage collectors permanent
+        generation. When run before forking workers, for example with
+        gunicorn ``--preload``, workers start with views ready to serve and
+        share the preloaded memory with the master process.
+
+        This should be called once all views are registered, including any
+        ``Flask-Admin`` views, for example at the end of an application
+        factory::
+
+            velox.preload(app)
+
+        Arguments
+        ---------
+        app : object
+            Flask application object
+        """
+
+        try:
+            from sqlalchemy.orm import configure_mappers
+        except ImportError:
+            pass
+        else:
+            configure_mappers()
+
+        # Sort url rules so the first url build or match does not have to
+        app.url_map.update()
+
+        for kls in self.get_view_classes(app):
+            self.preload_view(app, kls)
+
+        gc.collect()
+
+        # Python 3.7+, keeps forked workers from touching preloaded objects
+        if hasattr(gc, 'freeze'):
+            gc.freeze()
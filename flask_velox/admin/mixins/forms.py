@@ -30,6 +30,12 @@ class AdminBaseFormMixin(ContextMixin, AdminTemplateMixin):
         Flask url rule for cancel link, defaults to ``.index``
     """
 
+    _option_defaults = {
+        'redirect_url_rule': '.index',
+        'cancel_url_rule': '.index',
+        'delete_url_rule': '.delete',
+    }
+
     def set_context(self):
         """ Adds extra context variables.
 
@@ -64,7 +70,7 @@ class AdminBaseFormMixin(ContextMixin, AdminTemplateMixin):
             Raw flask url endpoint
         """
 
-        return getattr(self, 'redirect_url_rule', '.index')
+        return self._options.redirect_url_rule
 
     def get_cancel_url_rule(self):
         """ Returns the ``cancel_url_rule`` or raises NotImplementedError if
@@ -76,7 +82,7 @@ class AdminBaseFormMixin(ContextMixin, AdminTemplateMixin):
             Defined ``cancel_url_rule``
         """
 
-        return getattr(self, 'cancel_url_rule', '.index')
+        return self._options.cancel_url_rule
 
     def cancel_url(self, **kwargs):
         """ Returns the url to a cancel endpoint, this is used to render a link
@@ -113,7 +119,7 @@ class AdminBaseFormMixin(ContextMixin, AdminTemplateMixin):
             Defined ``delete_url_rule``
         """
 
-        return getattr(self, 'delete_url_rule', '.delete')
+        return self._options.delete_url_rule
 
     def delete_url(self, **kwargs):
         """ Returns the url to a delete endpoint, this is used to render a link
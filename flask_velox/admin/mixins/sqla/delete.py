@@ -22,6 +22,11 @@ class AdminDeleteBaseMixin(object):
     """ Base mixin class to be used inconjunction with other mixin classes.
     """
 
+    _option_defaults = {
+        'redirect_url_rule': '.index',
+        'cancel_url_rule': '.index',
+    }
+
     def set_context(self):
         """ Adds extra context variables to be used in delete view templates.
 
@@ -51,7 +56,7 @@ class AdminDeleteBaseMixin(object):
             Defined ``cancel_url_rule``
         """
 
-        return getattr(self, 'cancel_url_rule', '.index')
+        return self._options.cancel_url_rule
 
     def get_redirect_url_rule(self):
         """ Returns raw redirect url rule to be used in ``url_for``. If the
@@ -64,7 +69,7 @@ class AdminDeleteBaseMixin(object):
             Raw flask url endpoint
         """
 
-        return getattr(self, 'redirect_url_rule', '.index')
+        return self._options.redirect_url_rule
 
     def cancel_url(self, **kwargs):
         """ Returns the url to a cancel endpoint, this is used to render a link
@@ -13,6 +13,7 @@ The following packages must be installed:
 
 from flask import url_for
 from flask_velox.mixins.sqla.read import TableModelMixin
+from flask_velox.urls import UrlBuilder
 
 
 class AdminTableModelMixin(TableModelMixin):
@@ -62,6 +63,13 @@ class AdminTableModelMixin(TableModelMixin):
         of the link.
     """
 
+    _option_defaults = {
+        'create_url_rule': '.create',
+        'update_url_rule': '.update',
+        'delete_url_rule': '.delete',
+        'with_selected': None,
+    }
+
     def set_context(self):
         """ Adds extra context to Admin Table Views for ``Flask-Admin``
         systems
@@ -77,24 +85,60 @@ class AdminTableModelMixin(TableModelMixin):
         * ``create_url_rule``: The raw url rule or ``None``
         * ``create_url``: Create url method
         * ``update_url_rule``: The raw url rule or ``None``
-        * ``update_url``: Update url method
+        * ``update_url``: Update url builder
         * ``delete_url_rule``: The raw url rule or ``None``
-        * ``delete_url``: Delete url method
+        * ``delete_url``: Delete url builder
         * ``with_selcted``: With selcted values
+
+        The update and delete urls are rendered for every row so are passed
+        to the template as :py:class:`flask_velox.urls.UrlBuilder` instances
+        which are resolved once per request, see :py:meth:`get_url_builder`.
         """
 
         super(AdminTableModelMixin, self).set_context()
 
+        update_url_rule = self.get_update_url_rule()
+        delete_url_rule = self.get_delete_url_rule()
+
         self.merge_context({
             'create_url_rule': self.get_create_url_rule(),
             'create_url': self.create_url,
-            'update_url_rule': self.get_update_url_rule(),
-            'update_url': self.update_url,
-            'delete_url_rule': self.get_delete_url_rule(),
-            'delete_url': self.delete_url,
+            'update_url_rule': update_url_rule,
+            'update_url': self.get_url_builder(update_url_rule)
+            if update_url_rule else self.update_url,
+            'delete_url_rule': delete_url_rule,
+            'delete_url': self.get_url_builder(delete_url_rule)
+            if delete_url_rule else self.delete_url,
             'with_selected': self.get_with_selected(),
         })
 
+    def get_url_builder(self, rule):
+        """ Returns a :py:class:`flask_velox.urls.UrlBuilder` for the given
+        rule. Builders are cached on the view instance so each rule is only
+        resolved once per request no matter how many rows are rendered.
+
+        Arguments
+        ---------
+        rule : str
+            Raw Flask url rule
+
+        Returns
+        -------
+        flask_velox.urls.UrlBuilder
+            Url builder for the rule
+        """
+
+        try:
+            builders = self._url_builders
+        except AttributeError:
+            builders = self._url_builders = {}
+
+        try:
+            return builders[rule]
+        except KeyError:
+            builder = builders[rule] = UrlBuilder(rule)
+            return builder
+
     def get_create_url_rule(self):
         """ Returns the ``create_url_rule`` or None if not defined.
 
@@ -104,7 +148,7 @@ class AdminTableModelMixin(TableModelMixin):
             Defined ``create_url_rule`` or None
         """
 
-        return getattr(self, 'create_url_rule', '.create')
+        return self._options.create_url_rule
 
     def get_update_url_rule(self):
         """ Returns the ``update_url_rule`` or None if not defined.
@@ -115,7 +159,7 @@ class AdminTableModelMixin(TableModelMixin):
             Defined ``update_url_rule`` or None
         """
 
-        return getattr(self, 'update_url_rule', '.update')
+        return self._options.update_url_rule
 
     def get_delete_url_rule(self):
         """ Returns the ``delete_url_rule`` or None if not defined.
@@ -126,7 +170,7 @@ class AdminTableModelMixin(TableModelMixin):
             Defined ``delete_url_rule`` or None
         """
 
-        return getattr(self, 'delete_url_rule', '.delete')
+        return self._options.delete_url_rule
 
     def get_with_selected(self):
         """ Just returns the value of ``with_selected`` or None of not
@@ -138,7 +182,7 @@ class AdminTableModelMixin(TableModelMixin):
             Values of ``with_selcted``
         """
 
-        return getattr(self, 'with_selected', None)
+        return self._options.with_selected
 
     def create_url(self, **kwargs):
         """ Returns the url to a create endpoint, this is used to render a link
@@ -161,7 +205,7 @@ class AdminTableModelMixin(TableModelMixin):
             Generated url or None
         """
 
-        rule = getattr(self, 'create_url_rule', '.create')
+        rule = self.get_create_url_rule()
         if rule:
             return url_for(rule, **kwargs)
 
@@ -191,7 +235,7 @@ class AdminTableModelMixin(TableModelMixin):
 
         rule = self.get_update_url_rule()
         if rule:
-            return url_for(rule, **kwargs)
+            return self.get_url_builder(rule)(**kwargs)
 
         return None
 
@@ -219,6 +263,6 @@ class AdminTableModelMixin(TableModelMixin):
 
         rule = self.get_delete_url_rule()
         if rule:
-            return url_for(rule, **kwargs)
+            return self.get_url_builder(rule)(**kwargs)
 
         return None
@@ -5,6 +5,7 @@ Module provides mixin classes for integrating ``Flask-Velox`` Views with
 ``Flask-Admin``.
 """
 
+from flask_velox.instrumentation import phase
 from flask_velox.mixins.template import TemplateMixin
 
 
@@ -50,9 +51,10 @@ class AdminTemplateMixin(TemplateMixin):
         # context dict
         get_context = getattr(self, 'get_context', lambda: {})
 
-        return admin.render(
-            self._template,
-            **get_context())
+        with phase('render'):
+            return admin.render(
+                self._template,
+                **get_context())
 
     def get(self, admin, *args, **kwargs):
         """ Handles HTTP GET requests to View. Also sets ``self._admin``
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+""" Allocation profiling of ``Flask-Velox`` views using ``tracemalloc``.
+
+When ``VELOX_ALLOCATIONS`` is set requests to the configured endpoints run
+their view with ``tracemalloc`` tracing allocations. The peak memory used by
+the view and the source lines which allocated the most memory still held at
+the end of rendering, while the view and its context are alive, are logged to
+the ``flask_velox.allocations`` logger, for example showing if
+``query.all()``, context or formatters dominate the memory used by a
+``TableModelView``. Views which do not render a template are measured when
+they return.
+
+Tracing slows requests down considerably and traced requests are run one at
+a time. ``tracemalloc`` traces the whole process, so memory allocated by
+other requests handled concurrently by the same process is included in
+reports. Enable it on a staging environment or a single worker handling one
+request at a time rather than everywhere.
+
+Configuration
+-------------
+
+* ``VELOX_ALLOCATIONS``: ``True`` to trace all ``Flask-Velox`` endpoints or a
+  list of endpoints to trace
+* ``VELOX_ALLOCATIONS_TOP``: Number of allocation sites reported, defaults to
+  ``10``
+* ``VELOX_ALLOCATIONS_URL``: Url to expose the latest report for each
+  endpoint as JSON on, not exposed by default. Restrict access to it in your
+  web server configuration
+"""
+
+import logging
+import threading
+import time
+
+from flask import current_app, g, jsonify, request
+
+
+#: Logger reports are written to
+logger = logging.getLogger('flask_velox.allocations')
+
+
+def snapshot():
+    """ Takes the allocation snapshot for the current request if it is being
+    traced. Called once a template is rendered by
+    :py:meth:`flask_velox.mixins.template.TemplateMixin.render`, while the view
+    and its context are still alive.
+    """
+
+    held = getattr(g, '_velox_allocations', None)
+    if held is None:
+        return
+
+    import tracemalloc
+
+    current, peak = tracemalloc.get_traced_memory()
+    held[:] = [current, tracemalloc.take_snapshot()]
+
+
+class AllocationTracer(object):
+    """ Runs views with ``tracemalloc`` tracing allocations and keeps the
+    latest report for each endpoint.
+
+    Arguments
+    ---------
+    endpoints : list or None
+        Endpoints to trace, None to trace all endpoints
+    top : int, optional
+        Number of allocation sites reported, defaults to ``10``
+    """
+
+    def __init__(self, endpoints=None, top=10):
+        self.endpoints = endpoints
+        self.top = top
+        self.lock = threading.Lock()
+        self.reports = {}
+
+    def is_requested(self):
+        """ Returns if the current request should be traced.
+
+        Returns
+        -------
+        bool
+            Request endpoint is traced
+        """
+
+        return self.endpoints is None or request.endpoint in self.endpoints
+
+    def run(self, view, *args, **kwargs):
+        """ Calls a view function tracing allocations, waiting for any other
+        request being traced to finish first.
+
+        Arguments
+        ---------
+        view : function
+            View function
+        \*args
+            Positional view arguments
+        \*\*kwargs
+            Keyword view arguments
+
+        Returns
+        -------
+        object
+            View return value
+        """
+
+        import tracemalloc
+
+        self.lock.acquire()
+
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.clear_traces()
+        else:
+            tracemalloc.start()
+
+        held = g._velox_allocations = []
+        try:
+            return view(*args, **kwargs)
+        finally:
+            try:
+                g._velox_allocations = None
+                current, peak = tracemalloc.get_traced_memory()
+                if held:
+                    current, snapshot = held
+                else:
+                    snapshot = tracemalloc.take_snapshot()
+            finally:
+                if not tracing:
+                    tracemalloc.stop()
+                self.lock.release()
+            self.report(request.endpoint, current, peak, snapshot)
+
+    def report(self, endpoint, current, peak, snapshot):
+        """ Stores and logs the report for a traced request.
+
+        Arguments
+        ---------
+        endpoint : str
+            Request endpoint
+        current : int
+            Bytes allocated when the snapshot was taken
+        peak : int
+            Peak bytes allocated while the view ran
+        snapshot : tracemalloc.Snapshot
+            Allocations held at the end of rendering or when the view returned
+        """
+
+        import tracemalloc
+
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__)))
+        statistics = snapshot.statistics('lineno')[:self.top]
+
+        self.reports[endpoint] = {
+            'time': time.time(),
+            'path': request.path,
+            'current': current,
+            'peak': peak,
+            'top': [
+                {
+                    'site': '{0}:{1}'.format(
+                        stat.traceback[0].filename,
+                        stat.traceback[0].lineno),
+                    'size': stat.size,
+                    'count': stat.count,
+                }
+                for stat in statistics],
+        }
+
+        logger.info(
+            'Allocations for %s: peak %.1fKiB, held %.1fKiB\n%s',
+            request.path,
+            peak / 1024.0,
+            current / 1024.0,
+            '\n'.join(
+                '{0:>10.1f}KiB {1:>7} blocks {2}'.format(
+                    stat.size / 1024.0,
+                    stat.count,
+                    stat.traceback[0])
+                for stat in statistics))
+
+
+def allocations_view():
+    """ View returning the latest report for each traced endpoint as JSON.
+
+    Returns
+    -------
+    flask.Response
+        JSON response
+    """
+
+    tracer = current_app.extensions['velox_allocations']
+
+    return jsonify(tracer.reports)
+
+
+def init_app(app):
+    """ Enables allocation profiling for an application.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+    """
+
+    endpoints = app.config['VELOX_ALLOCATIONS']
+    tracer = AllocationTracer(
+        endpoints=None if endpoints is True else set(endpoints),
+        top=app.config.get('VELOX_ALLOCATIONS_TOP', 10))
+
+    app.extensions['velox_allocations'] = tracer
+    app.extensions.setdefault('velox_view_runners', []).append(tracer)
+
+    url = app.config.get('VELOX_ALLOCATIONS_URL')
+    if url:
+        app.add_url_rule(url, 'velox_allocations', allocations_view)
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+""" Cached choices for relationship select fields in model forms.
+
+``QuerySelectField`` and ``QuerySelectMultipleField`` load their choices by
+running a query each time a form is rendered or validated, usually reading
+the same reference table on every request. When ``cache_choices`` is
+``True`` on a create or update view the objects returned by these queries
+are cached per process, keyed by the SQL and parameters of the query. Each
+request receives copies of the cached objects merged into its own session
+without querying the database.
+
+Cached choices expire after ``VELOX_CHOICES_TTL`` seconds, defaults to
+``300``, and are invalidated when objects of the queried model are inserted,
+updated or deleted by a session in the same process and the session commits.
+
+Note
+----
+The following packages must be installed:
+
+* SQLAlchemy
+* WTForms
+
+Warning
+-------
+Writes made by other processes or by bulk ``Query.update`` and
+``Query.delete`` calls do not invalidate cached choices, they are seen once
+the cached choices expire.
+"""
+
+import threading
+import time
+
+from flask import current_app
+
+
+#: Cached objects keyed by query SQL and parameters
+_choices = {}
+_lock = threading.Lock()
+
+
+def get_key(query):
+    """ Returns the cache key for a query, its SQL and parameters.
+
+    Arguments
+    ---------
+    query : sqlalchemy.orm.query.Query
+        Choices query
+
+    Returns
+    -------
+    tuple
+        Cache key
+    """
+
+    compiled = query.statement.compile()
+
+    return str(compiled), repr(sorted(compiled.params.items()))
+
+
+def load(query):
+    """ Runs a query in a session of its own returning the objects detached
+    with their attributes loaded.
+
+    Arguments
+    ---------
+    query : sqlalchemy.orm.query.Query
+        Choices query
+
+    Returns
+    -------
+    list
+        Detached objects
+    """
+
+    from sqlalchemy.orm import Session, class_mapper
+
+    entity = query.column_descriptions[0]['entity']
+    session = Session(bind=query.session.get_bind(
+        mapper=class_mapper(entity)))
+
+    try:
+        return query.with_session(session).all()
+    finally:
+        session.close()
+
+
+def get_objects(query, ttl=300):
+    """ Returns the objects for a choices query from the cache, loading
+    them on first use or when expired. Objects are merged into the querys
+    session without querying the database.
+
+    Arguments
+    ---------
+    query : sqlalchemy.orm.query.Query
+        Choices query
+    ttl : int, optional
+        Seconds objects are cached for, defaults to ``300``
+
+    Returns
+    -------
+    list
+        Objects in the querys session
+    """
+
+    key = get_key(query)
+    entry = _choices.get(key)
+
+    if entry is None or entry[0] < time.time():
+        entities = tuple(
+            description['entity']
+            for description in query.column_descriptions)
+        objects = load(query)
+        entry = (time.time() + ttl, entities, objects)
+        with _lock:
+            _choices[key] = entry
+
+    session = query.session
+
+    return [session.merge(obj, load=False) for obj in entry[2]]
+
+
+def cache_choices(form):
+    """ Replaces the queries of ``QuerySelectField`` and
+    ``QuerySelectMultipleField`` fields of a form with cached objects. Must
+    be called before the fields choices are first accessed.
+
+    Arguments
+    ---------
+    form : object
+        Instantiated form
+    """
+
+    from sqlalchemy.orm import Query
+    from wtforms.ext.sqlalchemy.fields import QuerySelectField
+
+    listen_writes()
+
+    ttl = current_app.config.get('VELOX_CHOICES_TTL', 300)
+
+    for field in form:
+        if not isinstance(field, QuerySelectField):
+            continue
+        if field._object_list is not None:
+            continue
+
+        query = field.query
+        if query is None and field.query_factory is not None:
+            query = field.query_factory()
+        if not isinstance(query, Query):
+            continue
+
+        field.query = get_objects(query, ttl) or query
+
+
+def invalidate(classes):
+    """ Removes cached objects for queries of any of the given models.
+
+    Arguments
+    ---------
+    classes : set
+        Model classes written to
+    """
+
+    with _lock:
+        for key, (expires, entities, objects) in list(_choices.items()):
+            if any(
+                    issubclass(cls, entity) or issubclass(entity, cls)
+                    for cls in classes
+                    for entity in entities
+                    if isinstance(entity, type)):
+                _choices.pop(key, None)
+
+
+def after_flush(session, flush_context):
+    """ SQLAlchemy event listener recording the models written to by a
+    session until it commits.
+    """
+
+    written = session.info.setdefault('velox_written_models', set())
+    for obj in session.new | session.dirty | session.deleted:
+        written.add(obj.__class__)
+
+
+def after_commit(session):
+    """ SQLAlchemy event listener invalidating cached objects of models
+    written to by the committed transaction.
+    """
+
+    written = session.info.pop('velox_written_models', None)
+    if written:
+        invalidate(written)
+
+
+def after_rollback(session):
+    """ SQLAlchemy event listener discarding models written to by a rolled
+    back transaction.
+    """
+
+    session.info.pop('velox_written_models', None)
+
+
+def listen_writes():
+    """ Listen to writes made by all SQLAlchemy sessions, does nothing if
+    already listening.
+    """
+
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    if event.contains(Session, 'after_commit', after_commit):
+        return
+
+    event.listen(Session, 'after_flush', after_flush)
+    event.listen(Session, 'after_commit', after_commit)
+    event.listen(Session, 'after_rollback', after_rollback)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+""" ``flask`` command line commands, registered by ``Velox.init_app`` when
+the application supports them.
+
+Note
+----
+Requires Flask 0.11+ which provides the ``flask`` command line interface.
+"""
+
+import click
+
+from flask import current_app
+from flask.cli import with_appcontext
+from flask_velox import loadtest as harness
+from flask_velox.profiling import make_token
+
+
+#: Marks configuration values which were not set
+_missing = object()
+
+
+@click.group('velox')
+def velox():
+    """ Flask-Velox commands.
+    """
+
+    pass
+
+
+@velox.command('loadtest')
+@click.option('--concurrency', '-c', default=10, help='Concurrent clients.')
+@click.option('--requests', '-n', default=100, help='Requests per endpoint.')
+@click.option('--samples', default=10, help='Objects per object endpoint.')
+@click.option('--endpoint', '-e', multiple=True, help='Endpoints to test.')
+@click.option('--header', '-H', multiple=True, help='Header, "Name: value".')
+@click.option('--posts', is_flag=True, help='Post synthetic form payloads, '
+              'this writes to the database.')
+@with_appcontext
+def loadtest(concurrency, requests, samples, endpoint, header, posts):
+    """ Load test registered Flask-Velox endpoints.
+    """
+
+    app = current_app._get_current_object()
+
+    headers = {}
+    for h in header:
+        name, sep, value = h.partition(':')
+        if not sep or not name.strip():
+            raise click.BadParameter(
+                'headers must be "Name: value", not {0!r}'.format(h),
+                param_hint='--header')
+        headers[name.strip()] = value.strip()
+
+    csrf = app.config.get('WTF_CSRF_ENABLED', _missing)
+    if posts:
+        # Synthetic payloads can not contain a valid CSRF token
+        app.config['WTF_CSRF_ENABLED'] = False
+
+    try:
+        targets = harness.discover(app, posts=posts, samples=samples)
+        if endpoint:
+            targets = [t for t in targets if t.endpoint in endpoint]
+
+        if not targets:
+            raise click.ClickException('No Flask-Velox endpoints found.')
+
+        results = harness.run(
+            app,
+            targets,
+            concurrency=concurrency,
+            requests=requests,
+            headers=headers)
+    finally:
+        if csrf is _missing:
+            app.config.pop('WTF_CSRF_ENABLED', None)
+        else:
+            app.config['WTF_CSRF_ENABLED'] = csrf
+
+    for line in harness.report(results):
+        click.echo(line)
+
+
+@velox.command('profile-token')
+@click.option('--endpoint', '-e', default='*', help='Endpoint to profile.')
+@with_appcontext
+def profile_token(endpoint):
+    """ Print a single use token for the X-Velox-Profile header.
+    """
+
+    if 'velox_profiler' not in current_app.extensions:
+        raise click.ClickException('VELOX_PROFILE_DIR is not set.')
+
+    click.echo(make_token(endpoint=endpoint))
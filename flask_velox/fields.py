@@ -16,6 +16,7 @@ import ntpath
 import os
 
 from flask import current_app
+from flask_velox.instrumentation import phase
 from flask_wtf.file import FileField
 from werkzeug import secure_filename
 from werkzeug.datastructures import FileStorage
@@ -240,4 +241,5 @@ class UploadFileField(FileField):
         if not os.path.exists(base):
             os.makedirs(base)
 
-        self.data.save(absolute_path)
+        with phase('save', path=absolute_path):
+            self.data.save(absolute_path)
@@ -3,8 +3,6 @@
 """ Helper functions to assist in formatting data when rendering object data.
 """
 
-import pytz
-
 from jinja2 import Markup
 
 
@@ -97,5 +95,7 @@ def datetime_formatter(value):
         Formatted date time
     """
 
+    import pytz  # Imported on first use to keep module import cheap
+
     value = value.replace(tzinfo=pytz.utc)
     return value.strftime('%d/%m/%Y at %I:%M%p %Z')
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+
+""" Group commits for create views under high write concurrency.
+
+Each request to a create view normally commits its own transaction, on
+databases where every commit waits for the disk to sync, such as SQLite or
+PostgreSQL with ``synchronous_commit`` on, this caps the number of objects
+created per second. When ``group_commit`` is ``True`` on a create view the
+validated object is handed to a committer thread instead. The committer
+collects the objects submitted within a short window, inserts them in a
+single transaction and then releases every waiting request.
+
+If the transaction fails each object of the batch is committed in its own
+transaction so only requests with invalid objects fail, their exception is
+raised in the request.
+
+Configuration
+-------------
+
+* ``VELOX_GROUP_COMMIT_WINDOW``: Seconds the committer waits for more objects
+  after receiving the first object of a batch, defaults to ``0.005``
+* ``VELOX_GROUP_COMMIT_MAX_SIZE``: Maximum number of objects committed in one
+  transaction, defaults to ``100``
+* ``VELOX_GROUP_COMMIT_TIMEOUT``: Seconds a request waits for its object to be
+  committed before raising ``RuntimeError``, defaults to ``30``. Objects whose
+  batch is already being committed when the request gives up may still be
+  committed
+
+Note
+----
+The following packages must be installed:
+
+* SQLAlchemy 0.9.5 or later
+
+Warning
+-------
+Objects are merged into and committed by a session owned by the committer
+thread, not the views session, created by the views session factory when it
+is a ``scoped_session`` such as ``Flask-SQLAlchemy``'s. Each application has
+its own committer per engine which runs inside an application context of the
+application, but not a request context, so model events and hooks can not
+access the request. Once committed the column values are copied back
+to the submitted objects.
+"""
+
+import logging
+import threading
+import time
+
+from flask import current_app
+
+try:
+    from queue import Empty, Queue
+except ImportError:
+    from Queue import Empty, Queue
+
+
+#: Logger failures of the committer thread are written to
+logger = logging.getLogger('flask_velox.groupcommit')
+
+#: Guards creating committers, which are stored per application
+_lock = threading.Lock()
+
+
+class Pending(object):
+    """ An object waiting to be committed by a :py:class:`GroupCommitter`.
+
+    Arguments
+    ---------
+    obj : object
+        Model object to insert
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.error = None
+        self.cancelled = False
+        self.done = threading.Event()
+
+
+class GroupCommitter(object):
+    """ Commits objects submitted by concurrent requests in batches on a
+    background thread.
+
+    Arguments
+    ---------
+    bind : sqlalchemy.engine.Engine
+        Engine objects are committed to
+    app : object, optional
+        Flask application object whose application context is pushed while
+        committing
+    session_factory : callable, optional
+        Returns a new session bound to ``bind``, defaults to a SQLAlchemy
+        ``Session``
+    window : float, optional
+        Seconds to wait for more objects after the first object of a batch,
+        defaults to ``0.005``
+    max_size : int, optional
+        Maximum number of objects committed in one transaction, defaults to
+        ``100``
+    timeout : float, optional
+        Seconds :py:meth:`submit` waits for an object to be committed,
+        defaults to ``30``
+    """
+
+    def __init__(
+            self,
+            bind,
+            app=None,
+            session_factory=None,
+            window=0.005,
+            max_size=100,
+            timeout=30):
+        self.bind = bind
+        self.app = app
+        self.session_factory = session_factory
+        self.window = window
+        self.max_size = max_size
+        self.timeout = timeout
+        self.queue = Queue()
+        self.thread = threading.Thread(
+            target=self.run,
+            name='velox-group-commit')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def submit(self, obj):
+        """ Submits an object to be committed and waits until its batch is
+        committed.
+
+        Arguments
+        ---------
+        obj : object
+            Model object to insert
+
+        Raises
+        ------
+        RuntimeError
+            If the object was not committed within ``timeout`` seconds
+        Exception
+            Any exception raised committing the object
+        """
+
+        pending = Pending(obj)
+        self.queue.put(pending)
+
+        if not pending.done.wait(self.timeout):
+            pending.cancelled = True
+            raise RuntimeError(
+                'Group commit did not finish within {0} seconds'.format(
+                    self.timeout))
+
+        if pending.error is not None:
+            raise pending.error
+
+    def run(self):
+        """ Committer thread loop, collects batches of pending objects and
+        commits them. Any exception raised handling a batch, including
+        pushing or tearing down the application context, is raised in the
+        requests waiting on it and the loop carries on.
+        """
+
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.time() + self.window
+
+            while len(batch) < self.max_size:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except Empty:
+                    break
+
+            try:
+                if self.app is None:
+                    self.commit(batch)
+                else:
+                    with self.app.app_context():
+                        self.commit(batch)
+            except Exception as e:
+                logger.exception('Group commit failed')
+                for pending in batch:
+                    if not pending.done.is_set():
+                        pending.error = e
+                        pending.done.set()
+
+    def commit(self, batch):
+        """ Commits a batch in one transaction, if the transaction fails each
+        object is committed in its own transaction. Waiting requests are
+        released once their object is committed or failed.
+
+        Arguments
+        ---------
+        batch : list
+            :py:class:`Pending` objects
+        """
+
+        batch = [pending for pending in batch if not pending.cancelled]
+        if not batch:
+            return
+
+        try:
+            try:
+                self.insert([pending.obj for pending in batch])
+            except Exception as e:
+                if len(batch) == 1:
+                    batch[0].error = e
+                    return
+                for pending in batch:
+                    try:
+                        self.insert([pending.obj])
+                    except Exception as error:
+                        pending.error = error
+        finally:
+            for pending in batch:
+                pending.done.set()
+
+    def insert(self, objs):
+        """ Inserts objects in a single transaction. Objects are merged into
+        the committers session, as they and objects they are related to may
+        belong to the views session, and once committed their column values,
+        including primary keys, are copied back to them.
+
+        Arguments
+        ---------
+        objs : list
+            Model objects to insert, not attached to any session
+        """
+
+        from sqlalchemy.orm import Session, object_mapper
+        from sqlalchemy.orm.attributes import set_committed_value
+
+        if self.session_factory is None:
+            session = Session(bind=self.bind)
+        else:
+            session = self.session_factory()
+
+        try:
+            merged = [session.merge(obj) for obj in objs]
+            session.flush()
+            # Read before committing, which may expire attributes
+            values = [
+                dict(
+                    (prop.key, copy.__dict__[prop.key])
+                    for prop in object_mapper(copy).column_attrs
+                    if prop.key in copy.__dict__)
+                for copy in merged]
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        for obj, columns in zip(objs, values):
+            for key, value in columns.items():
+                set_committed_value(obj, key, value)
+
+
+def get_committer(bind, session_factory=None):
+    """ Returns the current applications committer for an engine, created on
+    first use with the applications configuration and stored in its
+    ``velox_group_committers`` extension.
+
+    Arguments
+    ---------
+    bind : sqlalchemy.engine.Engine
+        Engine objects are committed to
+    session_factory : callable, optional
+        Returns a new session, used when the committer is created
+
+    Returns
+    -------
+    GroupCommitter
+        Committer for the engine
+    """
+
+    app = current_app._get_current_object()
+
+    try:
+        return app.extensions['velox_group_committers'][bind]
+    except KeyError:
+        pass
+
+    with _lock:
+        committers = app.extensions.setdefault('velox_group_committers', {})
+        if bind not in committers:
+            committers[bind] = GroupCommitter(
+                bind,
+                app=app,
+                session_factory=session_factory,
+                window=app.config.get('VELOX_GROUP_COMMIT_WINDOW', 0.005),
+                max_size=app.config.get('VELOX_GROUP_COMMIT_MAX_SIZE', 100),
+                timeout=app.config.get('VELOX_GROUP_COMMIT_TIMEOUT', 30))
+
+    return committers[bind]
@@ -0,0 +1,505 @@
+# -*- coding: utf-8 -*-
+
+""" Instrumentation of the phases ``Flask-Velox`` views go through when
+handling a request, for example assembling context, executing SQL queries,
+validating forms, rendering templates and generating redirects.
+
+Phases are only timed when instrumentation is enabled for the application,
+either by ``VELOX_SERVER_TIMING``, ``VELOX_METRICS``, ``VELOX_TRACING`` or
+``VELOX_SLOW_QUERY_THRESHOLD``, see :py:mod:`flask_velox.metrics`,
+:py:mod:`flask_velox.tracing` and :py:mod:`flask_velox.slowquery`.
+
+When ``VELOX_SERVER_TIMING`` is ``True`` the time spent in each phase is
+returned in a ``Server-Timing`` response header which can be inspected in
+browser developer tools, for example::
+
+    Server-Timing: context;dur=12.1, sql;dur=8.4;desc="3 calls"
+
+Phases
+------
+
+Phases nest, for example ``sql`` statements run within ``get_objects`` which
+runs within ``context``. Each phase is timed exclusive of the phases and
+statements nested within it, so the timings of a request add up to the time
+spent in the view rather than counting nested time more than once.
+
+* ``dispatch``: The view, from instantiation to returning a response, less
+  the time spent in the phases below
+* ``context``: Assembling template context, see
+  :py:meth:`flask_velox.mixins.context.ContextMixin.set_context`
+* ``get_objects``: Fetching model objects for list views
+* ``get_object``: Fetching a single model object
+* ``sql``: Each SQL statement executed, requires SQLAlchemy
+* ``validate``: Form validation
+* ``render``: Template rendering
+* ``redirect``: Generating redirect urls
+* ``save``: Saving uploaded files
+
+Counts
+------
+
+* ``rows``: Model objects fetched by views
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from flask import current_app, g, has_app_context, request
+from functools import partial, update_wrapper
+from flask_velox.tracing import record_error
+from timeit import default_timer
+
+
+def is_enabled():
+    """ Returns if phases should be timed for the current application.
+
+    Returns
+    -------
+    bool
+        Instrumentation is enabled
+    """
+
+    return has_app_context() and \
+        current_app.extensions.get('velox_instrumentation', False)
+
+
+def get_timings():
+    """ Returns timings recorded for the current request.
+
+    Returns
+    -------
+    collections.OrderedDict
+        Phase name as key, tuple of total milliseconds and number of times
+        the phase was recorded as the value
+    """
+
+    try:
+        return g._velox_timings
+    except AttributeError:
+        timings = g._velox_timings = OrderedDict()
+        return timings
+
+
+def record(name, duration):
+    """ Record time spent in a phase for the current request.
+
+    Arguments
+    ---------
+    name : str
+        Phase name
+    duration : float
+        Time spent in milliseconds
+    """
+
+    timings = get_timings()
+    total, count = timings.get(name, (0, 0))
+    timings[name] = (total + duration, count + 1)
+
+
+def get_counts():
+    """ Returns counts recorded for the current request.
+
+    Returns
+    -------
+    collections.OrderedDict
+        Count name as key, total as the value
+    """
+
+    try:
+        return g._velox_counts
+    except AttributeError:
+        counts = g._velox_counts = OrderedDict()
+        return counts
+
+
+def count(name, value=1):
+    """ Add to a count for the current request, for example the number of
+    rows fetched. Does nothing when instrumentation is not enabled.
+
+    Arguments
+    ---------
+    name : str
+        Count name
+    value : int, optional
+        Amount to add, defaults to ``1``
+    """
+
+    if is_enabled():
+        counts = get_counts()
+        counts[name] = counts.get(name, 0) + value
+
+
+def get_phases():
+    """ Returns the phases the current request is in, innermost last.
+
+    Returns
+    -------
+    list
+        Tuples of phase name and attributes
+    """
+
+    try:
+        return g._velox_phases
+    except AttributeError:
+        phases = g._velox_phases = []
+        return phases
+
+
+def get_nested():
+    """ Returns the time spent in phases nested within each phase the
+    current request is in, innermost last.
+
+    Returns
+    -------
+    list
+        Milliseconds spent in nested phases
+    """
+
+    try:
+        return g._velox_nested
+    except AttributeError:
+        nested = g._velox_nested = []
+        return nested
+
+
+def add_nested(duration):
+    """ Adds time spent in a nested phase to the phase enclosing it.
+
+    Arguments
+    ---------
+    duration : float
+        Time spent in milliseconds
+    """
+
+    nested = get_nested()
+    if nested:
+        nested[-1] += duration
+
+
+def get_tracer():
+    """ Returns the tracer for the current application if tracing is enabled.
+
+    Returns
+    -------
+    object or None
+        OpenTelemetry tracer
+    """
+
+    return current_app.extensions.get('velox_tracer')
+
+
+@contextmanager
+def phase(name, **attributes):
+    """ Context manager timing the code it wraps as a phase of the current
+    request and when tracing is enabled wrapping it in a span named
+    ``velox.<name>``. Time spent in nested phases is not included in the
+    phases timing. Does nothing when instrumentation is not enabled.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        with phase('render'):
+            return render_template(self._template, **get_context())
+
+    Arguments
+    ---------
+    name : str
+        Phase name
+    \*\*attributes
+        Span attributes, ``None`` values are ignored
+    """
+
+    if not is_enabled():
+        yield
+        return
+
+    tracer = get_tracer()
+    phases = get_phases()
+    phases.append((name, attributes))
+    nested = get_nested()
+    nested.append(0.0)
+    start = default_timer()
+    try:
+        if tracer is None:
+            yield
+        else:
+            attributes = dict(
+                (k, v) for k, v in attributes.items() if v is not None)
+            with tracer.start_as_current_span(
+                    'velox.' + name,
+                    attributes=attributes,
+                    record_exception=False,
+                    set_status_on_exception=False) as span:
+                try:
+                    yield
+                except Exception as error:
+                    record_error(span, error)
+                    raise
+    finally:
+        duration = (default_timer() - start) * 1000
+        record(name, duration - nested.pop())
+        phases.pop()
+        add_nested(duration)
+
+
+def instrument_view(view):
+    """ Wraps a view function returned by ``as_view`` in a ``dispatch``
+    phase. The phase includes instantiating the view class, which is where
+    context is assembled.
+
+    Requests may instead be run by the first ``velox_view_runners``
+    application extension whose ``is_requested`` method returns ``True``,
+    for example to profile them, see :py:mod:`flask_velox.profiling` and
+    :py:mod:`flask_velox.allocations`.
+
+    Arguments
+    ---------
+    view : function
+        View function returned by ``View.as_view``
+
+    Returns
+    -------
+    function
+        Wrapped view function
+    """
+
+    def dispatch(*args, **kwargs):
+        runners = current_app.extensions.get('velox_view_runners', ())
+        with phase(
+                'dispatch',
+                view=view.view_class.__name__,
+                endpoint=request.endpoint):
+            for runner in runners:
+                if runner.is_requested():
+                    return runner.run(view, *args, **kwargs)
+            return view(*args, **kwargs)
+
+    dispatch = update_wrapper(dispatch, view)
+    dispatch._velox_instrumented = True
+
+    return dispatch
+
+
+def instrument_views(app):
+    """ ``before_first_request`` handler wrapping the view functions of
+    ``Flask-Velox`` views registered with the application using
+    :py:func:`instrument_view`. Views are only wrapped when instrumentation
+    or profiling is enabled so requests otherwise call the view directly,
+    views registered after the first request are not instrumented.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+    """
+
+    from flask_velox.mixins.http import RedirectMixin
+    from flask_velox.mixins.template import TemplateMixin
+
+    for endpoint, view in list(app.view_functions.items()):
+        kls = getattr(view, 'view_class', None)
+        if kls is None or getattr(view, '_velox_instrumented', False):
+            continue
+        if issubclass(kls, (TemplateMixin, RedirectMixin)):
+            app.view_functions[endpoint] = instrument_view(view)
+
+
+def server_timing_header(timings):
+    """ Format timings as a ``Server-Timing`` header value.
+
+    Arguments
+    ---------
+    timings : dict
+        Timings returned from :py:func:`get_timings`
+
+    Returns
+    -------
+    str
+        Header value
+    """
+
+    metrics = []
+
+    for name, (total, count) in timings.items():
+        metric = '{0};dur={1:.1f}'.format(name, total)
+        if count > 1:
+            metric += ';desc="{0} calls"'.format(count)
+        metrics.append(metric)
+
+    return ', '.join(metrics)
+
+
+def reset_timings():
+    """ ``before_request`` handler clearing timings and counts, an
+    application context can outlive a single request, for example in tests.
+    """
+
+    g._velox_timings = OrderedDict()
+    g._velox_counts = OrderedDict()
+    g._velox_phases = []
+    g._velox_nested = []
+
+
+def add_server_timing(response):
+    """ ``after_request`` handler adding the ``Server-Timing`` header to the
+    response.
+
+    Arguments
+    ---------
+    response : object
+        Flask response object
+
+    Returns
+    -------
+    object
+        The response
+    """
+
+    timings = getattr(g, '_velox_timings', None)
+    if timings:
+        response.headers['Server-Timing'] = server_timing_header(timings)
+
+    return response
+
+
+def before_cursor_execute(conn, cursor, statement, params, context, many):
+    """ SQLAlchemy event listener recording when a statement started and
+    starting a ``velox.sql`` span if tracing is enabled.
+    """
+
+    span = None
+    if is_enabled():
+        tracer = get_tracer()
+        if tracer is not None:
+            span = tracer.start_span(
+                'velox.sql',
+                attributes={'db.statement': statement})
+
+    conn.info.setdefault('velox_query_start', []).append(
+        (default_timer(), span))
+
+
+def after_cursor_execute(conn, cursor, statement, params, context, many):
+    """ SQLAlchemy event listener recording the time spent executing a
+    statement as a ``sql`` phase and checking for slow statements.
+    """
+
+    starts = conn.info.get('velox_query_start')
+    if not starts:
+        return
+
+    start, span = starts.pop()
+    if span is not None:
+        span.end()
+    if not is_enabled():
+        return
+
+    duration = (default_timer() - start) * 1000
+    record('sql', duration)
+    add_nested(duration)
+
+    if 'velox_slow_queries' in current_app.extensions:
+        from flask_velox.slowquery import check
+        phases = get_phases()
+        view = None
+        for name, attributes in phases:
+            if name == 'dispatch':
+                view = attributes.get('view')
+        check(
+            conn,
+            statement,
+            params,
+            many,
+            duration,
+            phases[-1][0] if phases else None,
+            view)
+
+
+def handle_error(context):
+    """ SQLAlchemy event listener ending timing of statements which failed,
+    removing the start recorded by :py:func:`before_cursor_execute` so the
+    timings of later statements on the connection are not mismatched.
+    """
+
+    conn = context.connection
+    starts = conn.info.get('velox_query_start') if conn is not None else None
+    if not starts:
+        return
+
+    start, span = starts.pop()
+    if span is not None:
+        span.end()
+
+
+def listen_sql():
+    """ Listen to SQL statements executed by all SQLAlchemy engines, does
+    nothing if SQLAlchemy is not installed or already listening.
+    """
+
+    try:
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+    except ImportError:
+        return
+
+    if event.contains(Engine, 'after_cursor_execute', after_cursor_execute):
+        return
+
+    event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(Engine, 'after_cursor_execute', after_cursor_execute)
+    event.listen(Engine, 'handle_error', handle_error)
+
+
+def init_app(app):
+    """ Enables instrumentation for an application if ``VELOX_SERVER_TIMING``,
+    ``VELOX_METRICS`` or ``VELOX_TRACING`` is ``True`` or
+    ``VELOX_SLOW_QUERY_THRESHOLD`` is set. Profiling is enabled separately
+    by ``VELOX_PROFILE_DIR`` and ``VELOX_ALLOCATIONS``.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+    """
+
+    if app.config.get('VELOX_PROFILE_DIR'):
+        from flask_velox.profiling import init_app as init_profiling
+        init_profiling(app)
+
+    if app.config.get('VELOX_ALLOCATIONS'):
+        from flask_velox.allocations import init_app as init_allocations
+        init_allocations(app)
+
+    server_timing = app.config.get('VELOX_SERVER_TIMING', False)
+    metrics = app.config.get('VELOX_METRICS', False)
+    tracing = app.config.get('VELOX_TRACING', False)
+    slow_queries = app.config.get('VELOX_SLOW_QUERY_THRESHOLD') is not None
+
+    instrumented = any((server_timing, metrics, tracing, slow_queries))
+
+    if instrumented or app.extensions.get('velox_view_runners'):
+        app.before_first_request(partial(instrument_views, app))
+
+    if not instrumented:
+        return
+
+    app.extensions['velox_instrumentation'] = True
+
+    listen_sql()
+    app.before_request(reset_timings)
+
+    if server_timing:
+        app.after_request(add_server_timing)
+
+    if metrics:
+        from flask_velox.metrics import init_app as init_metrics
+        init_metrics(app)
+
+    if tracing:
+        from flask_velox.tracing import init_app as init_tracing
+        init_tracing(app)
+
+    if slow_queries:
+        from flask_velox.slowquery import init_app as init_slow_queries
+        init_slow_queries(app)
@@ -0,0 +1,456 @@
+# -*- coding: utf-8 -*-
+
+""" Load testing harness for applications using ``Flask-Velox`` views.
+Registered ``Flask-Velox`` endpoints are discovered from the applications url
+map and requests generated for them, for example list pages, object pages and
+optionally form posts with synthetic payloads. Requests are sent to the
+application served by a local WSGI server from a number of concurrent
+clients and throughput and latency reported per endpoint.
+
+Example
+-------
+
+With Flask 0.11+ the harness is available as a ``flask`` command once
+``Velox.init_app`` has been called::
+
+    flask velox loadtest --concurrency 20 --requests 500
+
+It can also be run from python:
+
+.. code-block:: python
+    :linenos:
+
+    from flask.ext.velox import loadtest
+    from yourapp import app
+
+    with app.app_context():
+        targets = loadtest.discover(app)
+    results = loadtest.run(app, targets, concurrency=20, requests=500)
+    for line in loadtest.report(results):
+        print(line)
+
+Warning
+-------
+Form posts write to the database the application is configured with, only
+enable them against a disposable database.
+"""
+
+import math
+import threading
+import time
+
+from flask_velox.mixins.http import RedirectMixin
+from flask_velox.mixins.template import TemplateMixin
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+try:
+    from http.client import HTTPConnection
+    from queue import Empty, Queue
+    from urllib.parse import urlencode
+except ImportError:  # Python 2
+    from httplib import HTTPConnection
+    from Queue import Empty, Queue
+    from urllib import urlencode
+
+
+class Target(object):
+    """ A single endpoint to generate requests for.
+
+    Attributes
+    ----------
+    endpoint : str
+        Flask endpoint name
+    method : str
+        HTTP method, ``GET`` or ``POST``
+    urls : list
+        Urls to cycle through when generating requests
+    data : dict or None
+        Form payload for ``POST`` requests
+    """
+
+    def __init__(self, endpoint, method, urls, data=None):
+        self.endpoint = endpoint
+        self.method = method
+        self.urls = urls
+        self.data = data
+
+    @property
+    def name(self):
+        """ Returns the name used to report on the target.
+
+        Returns
+        -------
+        str
+            Method and endpoint
+        """
+
+        return '{0} {1}'.format(self.method, self.endpoint)
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """ Request handler which does not log each request to stderr.
+    """
+
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+def field_value(field):
+    """ Returns a synthetic value for a form field based on its type.
+
+    Arguments
+    ---------
+    field : object
+        Bound WTForms field
+
+    Returns
+    -------
+    str or None
+        Value to post or ``None`` if the field should not be posted
+    """
+
+    kind = field.type
+
+    if kind in ('CSRFTokenField', 'FileField', 'UploadFileField'):
+        return None
+
+    choices = getattr(field, 'choices', None)
+    if choices:
+        return u'{0}'.format(choices[0][0])
+
+    if kind == 'BooleanField':
+        return u'y'
+    if kind in ('IntegerField', 'DecimalField', 'FloatField'):
+        return u'1'
+    if kind == 'DateField':
+        return u'2014-01-01'
+    if kind == 'DateTimeField':
+        return u'2014-01-01 00:00:00'
+
+    return u'loadtest'
+
+
+def form_payload(app, kls, prefix=''):
+    """ Returns a synthetic payload for a form class.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+    kls : class
+        WTForms form class
+    prefix : str, optional
+        Form prefix
+
+    Returns
+    -------
+    dict
+        Field names and values
+    """
+
+    data = {}
+
+    with app.test_request_context():
+        form = kls(prefix=prefix)
+        for field in form:
+            value = field_value(field)
+            if value is not None:
+                data[field.name] = value
+
+    if prefix:
+        data['form'] = prefix
+
+    return data
+
+
+def get_payload(app, kls):
+    """ Returns a synthetic form payload for a view class or ``None`` if the
+    view does not render forms.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+    kls : class
+        View class
+
+    Returns
+    -------
+    dict or None
+        Field names and values
+    """
+
+    from flask_velox.mixins.forms import FormMixin, MultiFormMixin
+
+    if issubclass(kls, FormMixin) and getattr(kls, 'form', None):
+        return form_payload(app, kls.form)
+
+    if issubclass(kls, MultiFormMixin) and getattr(kls, 'forms', None):
+        name, form = kls.forms[0]
+        return form_payload(app, form, prefix='form1')
+
+    return None
+
+
+def get_values(kls, arguments, samples):
+    """ Returns values to build urls with for rules with arguments. Values
+    are looked up from existing model objects using the views
+    ``lookup_field``.
+
+    Arguments
+    ---------
+    kls : class
+        View class
+    arguments : set
+        Rule argument names
+    samples : int
+        Maximum number of objects to lookup
+
+    Returns
+    -------
+    list
+        Dicts of rule arguments and values
+    """
+
+    if not arguments:
+        return [{}]
+
+    model = getattr(kls, 'model', None)
+    field = getattr(kls, 'lookup_field', 'id')
+    if model is None or not arguments == set([field]):
+        return []
+
+    return [
+        {field: getattr(obj, field)}
+        for obj in model.query.limit(samples).all()]
+
+
+def discover(app, posts=False, samples=10):
+    """ Discovers ``Flask-Velox`` endpoints registered with the application
+    and returns targets to generate requests for. Must be called within an
+    application context as model objects are queried for object urls.
+
+    Delete views only receive ``GET`` requests and are skipped if they do not
+    require confirmation.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+    posts : bool, optional
+        Generate form posts with synthetic payloads, defaults to ``False``
+    samples : int, optional
+        Number of objects to generate object urls for, defaults to ``10``
+
+    Returns
+    -------
+    list
+        :py:class:`Target` instances
+    """
+
+    from flask_velox.mixins.sqla.delete import DeleteObjectMixin
+
+    adapter = app.url_map.bind('localhost')
+    targets = []
+
+    for rule in app.url_map.iter_rules():
+        view = app.view_functions.get(rule.endpoint)
+        kls = getattr(view, 'view_class', None)
+        if kls is None or not issubclass(kls, (TemplateMixin, RedirectMixin)):
+            continue
+
+        delete = issubclass(kls, DeleteObjectMixin)
+        if delete and not getattr(kls, 'confirm', True):
+            continue
+
+        urls = [
+            adapter.build(rule.endpoint, values)
+            for values in get_values(kls, rule.arguments, samples)]
+        if not urls:
+            continue
+
+        if 'GET' in rule.methods:
+            targets.append(Target(rule.endpoint, 'GET', urls))
+
+        if posts and not delete and 'POST' in rule.methods:
+            data = get_payload(app, kls)
+            if data is not None:
+                targets.append(Target(rule.endpoint, 'POST', urls, data))
+
+    return targets
+
+
+def percentile(values, percent):
+    """ Returns the nearest rank percentile of a sorted list of values.
+
+    Arguments
+    ---------
+    values : list
+        Sorted values
+    percent : int
+        Percentile, e.g: ``95``
+
+    Returns
+    -------
+    float or None
+        Value at the percentile or None if there are no values
+    """
+
+    if not values:
+        return None
+
+    index = int(math.ceil(percent / 100.0 * len(values))) - 1
+    return values[max(0, min(index, len(values) - 1))]
+
+
+def send(host, port, method, url, data=None, headers=None):
+    """ Send a single request returning the response status.
+    """
+
+    headers = dict(headers or {})
+    body = None
+
+    if data is not None:
+        body = urlencode(data)
+        headers['Content-Type'] = 'application/x-www-form-urlencoded'
+
+    connection = HTTPConnection(host, port)
+    try:
+        connection.request(method, url, body, headers)
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    finally:
+        connection.close()
+
+
+def run(app, targets, concurrency=10, requests=100, headers=None):
+    """ Serves the application with a local WSGI server and sends
+    ``requests`` requests to each target from ``concurrency`` clients.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+    targets : list
+        :py:class:`Target` instances
+    concurrency : int, optional
+        Number of concurrent clients, defaults to ``10``
+    requests : int, optional
+        Number of requests per target, defaults to ``100``
+    headers : dict, optional
+        Headers sent with every request, for example a session cookie
+
+    Returns
+    -------
+    list
+        Dicts of results per target, percentiles are None for targets which
+        received no requests
+    """
+
+    server = make_server(
+        '127.0.0.1',
+        0,
+        app,
+        threaded=True,
+        request_handler=QuietRequestHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    host, port = '127.0.0.1', server.server_port
+    results = []
+
+    try:
+        for target in targets:
+            jobs = Queue()
+            for i in range(requests):
+                jobs.put(target.urls[i % len(target.urls)])
+
+            latencies, errors = [], [0]
+            lock = threading.Lock()
+
+            def client():
+                while True:
+                    try:
+                        url = jobs.get_nowait()
+                    except Empty:
+                        return
+                    start = time.time()
+                    try:
+                        status = send(
+                            host,
+                            port,
+                            target.method,
+                            url,
+                            target.data,
+                            headers)
+                    except Exception:
+                        status = None
+                    elapsed = (time.time() - start) * 1000
+                    with lock:
+                        latencies.append(elapsed)
+                        if status is None or status >= 500:
+                            errors[0] += 1
+
+            start = time.time()
+            clients = [
+                threading.Thread(target=client)
+                for i in range(concurrency)]
+            for c in clients:
+                c.start()
+            for c in clients:
+                c.join()
+            duration = time.time() - start
+
+            latencies.sort()
+            results.append({
+                'target': target.name,
+                'requests': len(latencies),
+                'errors': errors[0],
+                'throughput': len(latencies) / duration if duration else 0.0,
+                'p50': percentile(latencies, 50),
+                'p95': percentile(latencies, 95),
+                'p99': percentile(latencies, 99),
+            })
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    return results
+
+
+def report(results):
+    """ Returns lines of a table reporting results from :py:func:`run`.
+
+    Arguments
+    ---------
+    results : list
+        Results returned from :py:func:`run`
+
+    Returns
+    -------
+    list
+        Lines of text
+    """
+
+    row = '{0:<48} {1:>8} {2:>7} {3:>9} {4:>9} {5:>9} {6:>9}'
+
+    def ms(value):
+        return '-' if value is None else '{0:.1f}'.format(value)
+
+    lines = [row.format(
+        'endpoint', 'requests', 'errors', 'req/s', 'p50 ms', 'p95 ms',
+        'p99 ms')]
+
+    for result in results:
+        lines.append(row.format(
+            result['target'],
+            result['requests'],
+            result['errors'],
+            '{0:.1f}'.format(result['throughput']),
+            ms(result['p50']),
+            ms(result['p95']),
+            ms(result['p99'])))
+
+    return lines
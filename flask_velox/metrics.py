@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+
+""" In process metrics for ``Flask-Velox`` views exposed in the Prometheus
+text exposition format.
+
+When ``VELOX_METRICS`` is ``True`` the following metrics are recorded for
+each request handled by a ``Flask-Velox`` view:
+
+* ``velox_requests_total``: Requests by endpoint, method and status
+* ``velox_request_duration_seconds``: Histogram of request latency by
+  endpoint
+* ``velox_phase_duration_seconds``: Histogram of time spent in each phase by
+  endpoint and phase, exclusive of nested phases, see
+  :py:mod:`flask_velox.instrumentation`
+* ``velox_queries_total``: SQL statements executed by endpoint
+* ``velox_rows_total``: Model objects fetched by endpoint
+* ``velox_response_bytes_total``: Bytes of responses by endpoint
+
+Configuration
+-------------
+
+* ``VELOX_METRICS_URL``: Url metrics are exposed on, for example
+  ``/metrics``, metrics are not exposed unless set
+* ``VELOX_METRICS_TOKEN``: Token scrapers must send in an
+  ``Authorization: Bearer <token>`` header, when not set access to the url
+  must be restricted by your web server configuration
+* ``VELOX_METRICS_DIR``: Directory shared by all worker processes, for example
+  gunicorn workers. Each process periodically writes its metrics to a file in
+  the directory and the metrics endpoint exposes the sum of all files
+* ``VELOX_METRICS_FLUSH_INTERVAL``: Seconds between writes to
+  ``VELOX_METRICS_DIR``, defaults to ``5``
+"""
+
+import hmac
+import json
+import os
+import tempfile
+import threading
+import time
+
+from flask import Response, current_app, g, request
+from flask_velox.instrumentation import get_counts, get_timings
+from flask_velox.mixins.http import RedirectMixin
+from flask_velox.mixins.template import TemplateMixin
+from timeit import default_timer
+
+
+#: Default latency histogram buckets in seconds
+BUCKETS = (.005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)
+
+#: Metric types and help text
+METRICS = {
+    'velox_requests_total': (
+        'counter',
+        'Requests handled by Flask-Velox views.'),
+    'velox_request_duration_seconds': (
+        'histogram',
+        'Latency of requests handled by Flask-Velox views.'),
+    'velox_phase_duration_seconds': (
+        'histogram',
+        'Time spent in each phase of requests handled by Flask-Velox views.'),
+    'velox_queries_total': (
+        'counter',
+        'SQL statements executed by Flask-Velox views.'),
+    'velox_rows_total': (
+        'counter',
+        'Model objects fetched by Flask-Velox views.'),
+    'velox_response_bytes_total': (
+        'counter',
+        'Bytes of responses returned by Flask-Velox views.'),
+}
+
+
+class Registry(object):
+    """ Thread safe registry of counters and histograms. Metrics are keyed by
+    name and a tuple of label name and value pairs.
+
+    Arguments
+    ---------
+    buckets : tuple, optional
+        Histogram bucket upper bounds, defaults to :py:data:`BUCKETS`
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+
+    def inc(self, name, value=1, **labels):
+        """ Increment a counter.
+
+        Arguments
+        ---------
+        name : str
+            Metric name
+        value : int, optional
+            Amount to increment by, defaults to ``1``
+        \*\*labels
+            Label names and values
+        """
+
+        key = (name, tuple(sorted(labels.items())))
+
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        """ Observe a value in a histogram.
+
+        Arguments
+        ---------
+        name : str
+            Metric name
+        value : float
+            Observed value
+        \*\*labels
+            Label names and values
+        """
+
+        key = (name, tuple(sorted(labels.items())))
+
+        with self.lock:
+            try:
+                histogram = self.histograms[key]
+            except KeyError:
+                # Bucket counts followed by sum and count
+                histogram = self.histograms[key] = \
+                    [0] * (len(self.buckets) + 2)
+
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram[i] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    def snapshot(self):
+        """ Returns the current values of all metrics in a form which can be
+        serialised to JSON.
+
+        Returns
+        -------
+        dict
+            Counters and histograms
+        """
+
+        with self.lock:
+            return {
+                'buckets': list(self.buckets),
+                'counters': [
+                    [name, list(labels), value]
+                    for (name, labels), value in self.counters.items()],
+                'histograms': [
+                    [name, list(labels), list(values)]
+                    for (name, labels), values in self.histograms.items()],
+            }
+
+
+def merge(snapshots):
+    """ Sum a list of snapshots returned from :py:meth:`Registry.snapshot`.
+
+    Arguments
+    ---------
+    snapshots : list
+        Snapshots to merge
+
+    Returns
+    -------
+    tuple
+        Buckets, dict of counters and dict of histograms keyed by name and
+        labels
+    """
+
+    buckets, counters, histograms = BUCKETS, {}, {}
+
+    for snapshot in snapshots:
+        buckets = snapshot['buckets']
+        for name, labels, value in snapshot['counters']:
+            key = (name, tuple(tuple(label) for label in labels))
+            counters[key] = counters.get(key, 0) + value
+        for name, labels, values in snapshot['histograms']:
+            key = (name, tuple(tuple(label) for label in labels))
+            if key in histograms:
+                values = [a + b for a, b in zip(histograms[key], values)]
+            histograms[key] = values
+
+    return buckets, counters, histograms
+
+
+def format_labels(labels, **extra):
+    """ Format label pairs as a Prometheus label set.
+    """
+
+    labels = list(labels) + sorted(extra.items())
+    if not labels:
+        return ''
+
+    return '{' + ','.join(
+        '{0}="{1}"'.format(
+            name,
+            str(value).replace('\\', '\\\\').replace('"', '\\"'))
+        for name, value in labels) + '}'
+
+
+def exposition(snapshots):
+    """ Format snapshots in the Prometheus text exposition format.
+
+    Arguments
+    ---------
+    snapshots : list
+        Snapshots returned from :py:meth:`Registry.snapshot`
+
+    Returns
+    -------
+    str
+        Metrics text
+    """
+
+    buckets, counters, histograms = merge(snapshots)
+    lines = []
+
+    for name in sorted(METRICS):
+        kind, description = METRICS[name]
+        lines.append('# HELP {0} {1}'.format(name, description))
+        lines.append('# TYPE {0} {1}'.format(name, kind))
+
+        for (key, labels), value in sorted(counters.items()):
+            if key == name:
+                lines.append('{0}{1} {2}'.format(
+                    name,
+                    format_labels(labels),
+                    value))
+
+        for (key, labels), values in sorted(histograms.items()):
+            if not key == name:
+                continue
+            for bound, value in zip(buckets, values):
+                lines.append('{0}_bucket{1} {2}'.format(
+                    name,
+                    format_labels(labels, le=bound),
+                    value))
+            lines.append('{0}_bucket{1} {2}'.format(
+                name,
+                format_labels(labels, le='+Inf'),
+                values[-1]))
+            lines.append('{0}_sum{1} {2}'.format(
+                name,
+                format_labels(labels),
+                values[-2]))
+            lines.append('{0}_count{1} {2}'.format(
+                name,
+                format_labels(labels),
+                values[-1]))
+
+    return '\n'.join(lines) + '\n'
+
+
+def get_registry():
+    """ Returns the metrics registry for the current application.
+
+    Returns
+    -------
+    Registry
+        Metrics registry
+    """
+
+    return current_app.extensions['velox_metrics']
+
+
+def is_velox_endpoint(app, endpoint):
+    """ Returns if an endpoint is handled by a ``Flask-Velox`` view.
+    """
+
+    view = app.view_functions.get(endpoint)
+    kls = getattr(view, 'view_class', None)
+
+    return kls is not None and issubclass(kls, (TemplateMixin, RedirectMixin))
+
+
+def path(directory):
+    """ Returns the path the current process writes its metrics to.
+    """
+
+    return os.path.join(directory, 'velox-{0}.json'.format(os.getpid()))
+
+
+def flush(app, force=False):
+    """ Write the metrics of the current process to ``VELOX_METRICS_DIR`` if
+    configured and ``VELOX_METRICS_FLUSH_INTERVAL`` has passed since the last
+    write. Files are written atomically so readers never see partial files.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+    force : bool, optional
+        Write regardless of the flush interval, defaults to ``False``
+    """
+
+    directory = app.config.get('VELOX_METRICS_DIR')
+    if not directory:
+        return
+
+    registry = app.extensions['velox_metrics']
+    interval = app.config.get('VELOX_METRICS_FLUSH_INTERVAL', 5)
+    now = time.time()
+
+    with registry.lock:
+        if not force and now - getattr(registry, 'flushed', 0) < interval:
+            return
+        registry.flushed = now
+
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(registry.snapshot(), f)
+    os.rename(tmp, path(directory))
+
+
+def start_timer():
+    """ ``before_request`` handler recording when the request started.
+    """
+
+    g._velox_request_start = default_timer()
+
+
+def record_request(response):
+    """ ``after_request`` handler recording metrics for requests handled by
+    ``Flask-Velox`` views.
+
+    Arguments
+    ---------
+    response : object
+        Flask response object
+
+    Returns
+    -------
+    object
+        The response
+    """
+
+    app = current_app._get_current_object()
+    start = getattr(g, '_velox_request_start', None)
+
+    if start is None or not is_velox_endpoint(app, request.endpoint):
+        return response
+
+    registry = get_registry()
+    endpoint = request.endpoint
+
+    registry.inc(
+        'velox_requests_total',
+        endpoint=endpoint,
+        method=request.method,
+        status=response.status_code)
+    registry.observe(
+        'velox_request_duration_seconds',
+        default_timer() - start,
+        endpoint=endpoint)
+
+    timings = get_timings()
+    for name, (total, calls) in timings.items():
+        registry.observe(
+            'velox_phase_duration_seconds',
+            total / 1000.0,
+            endpoint=endpoint,
+            phase=name)
+
+    registry.inc(
+        'velox_queries_total',
+        timings.get('sql', (0, 0))[1],
+        endpoint=endpoint)
+    registry.inc(
+        'velox_rows_total',
+        get_counts().get('rows', 0),
+        endpoint=endpoint)
+    registry.inc(
+        'velox_response_bytes_total',
+        response.calculate_content_length() or 0,
+        endpoint=endpoint)
+
+    flush(app)
+
+    return response
+
+
+def is_authorized(token):
+    """ Returns if the current request carries the metrics token in an
+    ``Authorization: Bearer`` header.
+
+    Arguments
+    ---------
+    token : str
+        Expected token
+
+    Returns
+    -------
+    bool
+        Request is authorized
+    """
+
+    scheme, _, value = request.headers.get('Authorization', '').partition(' ')
+    if scheme.lower() != 'bearer':
+        return False
+
+    return hmac.compare_digest(
+        value.strip().encode('utf-8'),
+        token.encode('utf-8'))
+
+
+def metrics_view():
+    """ View returning metrics in the Prometheus text exposition format. When
+    ``VELOX_METRICS_DIR`` is configured the metrics of all processes which
+    have written to the directory are summed. When ``VELOX_METRICS_TOKEN`` is
+    configured requests without the token are refused.
+
+    Returns
+    -------
+    flask.Response
+        Metrics text response
+    """
+
+    app = current_app._get_current_object()
+
+    token = app.config.get('VELOX_METRICS_TOKEN')
+    if token and not is_authorized(token):
+        return Response(
+            'Unauthorized\n',
+            401,
+            {'WWW-Authenticate': 'Bearer'},
+            mimetype='text/plain')
+    directory = app.config.get('VELOX_METRICS_DIR')
+
+    if not directory:
+        snapshots = [get_registry().snapshot()]
+    else:
+        flush(app, force=True)
+        snapshots = []
+        for name in os.listdir(directory):
+            if not name.startswith('velox-') or not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(directory, name)) as f:
+                    snapshots.append(json.load(f))
+            except (IOError, OSError, ValueError):
+                continue
+
+    return Response(
+        exposition(snapshots),
+        mimetype='text/plain; version=0.0.4')
+
+
+def init_app(app):
+    """ Creates a metrics registry for the application and registers request
+    handlers recording metrics. The metrics endpoint is only registered when
+    ``VELOX_METRICS_URL`` is set.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+    """
+
+    app.extensions['velox_metrics'] = Registry()
+    app.before_request(start_timer)
+    app.after_request(record_request)
+
+    url = app.config.get('VELOX_METRICS_URL')
+    if url:
+        app.add_url_rule(url, 'velox_metrics', metrics_view)
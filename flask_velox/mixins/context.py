@@ -26,16 +26,96 @@ Example
 
 """
 
+import threading
+import time
 
-class ContextMixin(object):
+from flask import copy_current_request_context, current_app
+from flask import has_request_context
+from flask._compat import with_metaclass
+from flask_velox.instrumentation import phase
+from flask_velox.options import OptionsType
+from multiprocessing import TimeoutError
+from multiprocessing.pool import ApplyResult, ThreadPool
+
+
+#: Thread pool shared by all views for running context providers
+_pool = None
+_pool_lock = threading.Lock()
+
+#: Pool threads free to run a context provider
+_slots = None
+
+
+def get_pool():
+    """ Returns the thread pool context providers are run on, created on
+    first use with ``VELOX_CONTEXT_WORKERS`` threads, defaults to ``4``.
+
+    Returns
+    -------
+    multiprocessing.pool.ThreadPool
+        Thread pool
+    """
+
+    global _pool, _slots
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                workers = current_app.config.get('VELOX_CONTEXT_WORKERS', 4)
+                _slots = threading.BoundedSemaphore(workers)
+                _pool = ThreadPool(workers)
+
+    return _pool
+
+
+def run_provider(task):
+    """ Runs a context provider on a pool thread, freeing the slot it was
+    submitted with once it finishes.
+
+    Arguments
+    ---------
+    task : function
+        Context provider bound to a copy of the request context
+
+    Returns
+    -------
+    object
+        Context value
+    """
+
+    try:
+        return task()
+    finally:
+        _slots.release()
+
+
+class ContextMixin(with_metaclass(OptionsType, object)):
     """ Mixin this class to add context support to template
     rendering. Default context can be defined by setting the ``context``
     attribute to contain a ``dict`` of key value pairs.
 
+    Independent pieces of context which are slow to build, for example
+    aggregate queries on a dashboard, can be declared as context providers
+    which are run concurrently on a shared thread pool while ``set_context``
+    runs. Each provider runs in a copy of the current request context, so
+    ``Flask-SQLAlchemy`` sessions, and their connections, are per provider.
+    A provider which raises or does not finish within ``context_timeout``
+    is logged and its context value is ``None``.
+
+    Work is never queued on the pool, when every pool thread is busy
+    providers are called by the request's own thread instead. A provider
+    which times out keeps its pool thread until it finishes, so slow
+    providers reduce the concurrency available to other requests rather
+    than making them wait.
+
     Attributes
     ----------
     context : dict, optional
         Default context to use when rendering the template
+    context_providers : dict, optional
+        Context names mapped to names of methods returning their values
+    context_timeout : float, optional
+        Seconds to wait for all context providers, defaults to ``10``
 
     Example
     -------
@@ -48,8 +128,25 @@ class ContextMixin(object):
                 'foo': 'bar',
             }
 
+        class DashboardView(ContextMixin):
+            context_providers = {
+                'users': 'count_users',
+                'orders': 'count_orders',
+            }
+
+            def count_users(self):
+                return User.query.count()
+
+            def count_orders(self):
+                return Order.query.count()
+
     """
 
+    _option_defaults = {
+        'context_providers': None,
+        'context_timeout': 10,
+    }
+
     def __init__(self, *args, **kwargs):
         """ Constructor
 
@@ -60,18 +157,137 @@ class ContextMixin(object):
         #: Holds the context value for the instance
         self._context = {}
 
-        # Merge default context into context if exists
-        context = getattr(self, 'context', {})
-        self.merge_context(context)
+        with phase('context'):
+            # Merge default context into context if exists
+            context = getattr(self, 'context', {})
+            self.merge_context(context)
+
+            # Start independent providers so they run alongside set_context
+            pending = self.start_context_providers()
 
-        # Call a callback method so class extending this can
-        # have a method override just for context rather than
-        # overridding HTTP verb methods such as get, post etc
-        if hasattr(self, 'set_context'):
-            self.merge_context(self.set_context())
+            # Call a callback method so class extending this can
+            # have a method override just for context rather than
+            # overridding HTTP verb methods such as get, post etc
+            if hasattr(self, 'set_context'):
+                self.merge_context(self.set_context())
+
+            self.merge_context(self.collect_context_providers(pending))
 
         super(ContextMixin, self).__init__(*args, **kwargs)
 
+    def get_context_providers(self):
+        """ Returns the context providers defined in ``context_providers``.
+
+        Returns
+        -------
+        dict
+            Context names mapped to method names
+        """
+
+        return self._options.context_providers or {}
+
+    def start_context_providers(self):
+        """ Submits each context provider to the thread pool, providers are
+        called immediately when every pool thread is busy or outside of a
+        request context.
+
+        Returns
+        -------
+        dict
+            Context names mapped to ``AsyncResult`` objects, or values when
+            providers were called immediately
+        """
+
+        providers = self.get_context_providers()
+        if not providers:
+            return {}
+
+        if not has_request_context():
+            return dict(
+                (name, getattr(self, method)())
+                for name, method in providers.items())
+
+        pool = get_pool()
+        pending = {}
+
+        for name, method in providers.items():
+            provider = getattr(self, method)
+            if _slots.acquire(False):
+                task = copy_current_request_context(provider)
+                pending[name] = pool.apply_async(run_provider, (task, ))
+            else:
+                pending[name] = self.call_context_provider(name, provider)
+
+        return pending
+
+    def call_context_provider(self, name, provider):
+        """ Calls a context provider in the current thread, a provider which
+        raises is logged and its value is ``None``.
+
+        Arguments
+        ---------
+        name : str
+            Context name
+        provider : function
+            Bound provider method
+
+        Returns
+        -------
+        object
+            Context value
+        """
+
+        try:
+            return provider()
+        except Exception:
+            current_app.logger.exception(
+                'Context provider %s of %s failed',
+                name,
+                self.__class__.__name__)
+            return None
+
+    def collect_context_providers(self, pending):
+        """ Waits for context providers submitted by
+        :py:meth:`start_context_providers` to finish, up to
+        ``context_timeout`` seconds in total. Providers which raise or time
+        out are logged and their value is ``None``, a timed out provider
+        keeps its thread until it finishes.
+
+        Arguments
+        ---------
+        pending : dict
+            Context names mapped to ``AsyncResult`` objects
+
+        Returns
+        -------
+        dict
+            Context names mapped to values
+        """
+
+        context = {}
+        deadline = time.time() + self._options.context_timeout
+
+        for name, result in pending.items():
+            if not isinstance(result, ApplyResult):
+                context[name] = result
+                continue
+            try:
+                context[name] = result.get(max(deadline - time.time(), 0))
+            except TimeoutError:
+                current_app.logger.error(
+                    'Context provider %s of %s timed out',
+                    name,
+                    self.__class__.__name__)
+                context[name] = None
+            except Exception:
+                current_app.logger.exception(
+                    'Context provider %s of %s failed',
+                    name,
+                    self.__class__.__name__)
+                context[name] = None
+
+        return context
+
     def get_context(self):
         """ Propety method which returns the current context.
 
@@ -11,10 +11,81 @@ The following packages must be installed:
 
 from collections import OrderedDict
 from flask import request, url_for
+from functools import partial
+from flask_velox.instrumentation import phase
 from flask_velox.mixins.context import ContextMixin
 from flask_velox.mixins.template import TemplateMixin
 from werkzeug.routing import RequestRedirect
 
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+
+class LazyForms(Mapping):
+    """ Ordered mapping of form prefixes to tuples of human readable form
+    name and form object. Forms can be added already instantiated or as a
+    callable which instantiates the form the first time it is accessed, so
+    forms which are never rendered are never built.
+    """
+
+    def __init__(self):
+        self._names = OrderedDict()
+        self._forms = {}
+        self._factories = {}
+
+    def add(self, prefix, name, form):
+        """ Add an instantiated form.
+
+        Arguments
+        ---------
+        prefix : str
+            Form prefix
+        name : str
+            Human readable form name
+        form : object
+            Instantiated form
+        """
+
+        self._names[prefix] = name
+        self._forms[prefix] = form
+
+    def add_lazy(self, prefix, name, factory):
+        """ Add a form to be instantiated on first access.
+
+        Arguments
+        ---------
+        prefix : str
+            Form prefix
+        name : str
+            Human readable form name
+        factory : callable
+            Returns the instantiated form
+        """
+
+        self._names[prefix] = name
+        self._factories[prefix] = factory
+
+    def __getitem__(self, prefix):
+        name = self._names[prefix]
+
+        try:
+            form = self._forms[prefix]
+        except KeyError:
+            form = self._forms[prefix] = self._factories.pop(prefix)()
+
+        return name, form
+
+    def __contains__(self, prefix):
+        return prefix in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
 
 class BaseFormMixin(ContextMixin, TemplateMixin):
     """ Base Form Mixin class, defines some standard methods required for
@@ -26,8 +97,21 @@ class BaseFormMixin(ContextMixin, TemplateMixin):
         Raw Flask url rule, e.g: ``some.url.rule``
     submit_url_rule : str, optional
         Flask url rule for form submit action e.g: 'some.url.rule'
+    prototype_forms : bool, optional
+        Instantiate forms by copying a prototype form created once per
+        process, see :py:mod:`flask_velox.prototypes`, defaults to ``False``
+    cache_form_markup : bool, optional
+        Cache the markup of forms not bound to any data, see
+        :py:mod:`flask_velox.rendercache`, defaults to ``False``
     """
 
+    _option_defaults = {
+        'submit_url_rule': None,
+        'redirect_url_rule': None,
+        'prototype_forms': False,
+        'cache_form_markup': False,
+    }
+
     def flash(self):
         """ Override this method to call a flask flash method. By default this
         method does nothing.
@@ -58,6 +142,8 @@ class BaseFormMixin(ContextMixin, TemplateMixin):
         Adds the following extra context variables:
 
         * ``is_hidden_field``: Function for determining is field is hidden
+        * ``form_fields_cache``: Function rendering form fields from the
+          render cache, only when ``cache_form_markup`` is ``True``
         """
 
         super(BaseFormMixin, self).set_context()
@@ -73,6 +159,12 @@ class BaseFormMixin(ContextMixin, TemplateMixin):
         except ImportError:
             pass
 
+        if self._options.cache_form_markup:
+            from flask_velox.rendercache import form_fields
+            self.add_context(
+                'form_fields_cache',
+                partial(form_fields, self._template))
+
     def get_submit_url_rule(self):
         """ Returns a submit url rule for usage in generating a submit form
         action url. Defaults to the views current url rule endpoint but can be
@@ -84,7 +176,11 @@ class BaseFormMixin(ContextMixin, TemplateMixin):
             Raw flask url rule endpoint
         """
 
-        return getattr(self, 'submit_url_rule', request.url_rule.endpoint)
+        rule = self._options.submit_url_rule
+        if rule is None:
+            return request.url_rule.endpoint
+
+        return rule
 
     def get_redirect_url_rule(self):
         """ Returns raw redirect url rule to be used in ``url_for``. The
@@ -102,11 +198,12 @@ class BaseFormMixin(ContextMixin, TemplateMixin):
             If ``redirect_url_rule`` is not defined
         """
 
-        try:
-            return self.redirect_url_rule
-        except AttributeError:
+        rule = self._options.redirect_url_rule
+        if rule is None:
             raise NotImplementedError('``redirect_url_rule`` must be defined.')
 
+        return rule
+
     def submit_url(self, **kwargs):
         """ Returns the url to a submit endpoint, this is used to render a link
         in forms actions::
@@ -155,7 +252,7 @@ class BaseFormMixin(ContextMixin, TemplateMixin):
         rule = self.get_redirect_url_rule()
         return url_for(rule, **kwargs)
 
-    def instantiate_form(self, kls=None, obj=None, prefix=''):
+    def instantiate_form(self, kls=None, obj=None, prefix='', **kwargs):
         """ Instantiates form if instance does not already exisst. Override
         this method to tailor form instantiation.
 
@@ -167,6 +264,9 @@ class BaseFormMixin(ContextMixin, TemplateMixin):
             Object to pass into the form to pre populate with
         prefix : str, optional
             Add a prefix to the form class
+        \*\*kwargs
+            Arbitrary keyword arguments passed to the form class, for example
+            ``formdata=None`` to build a form not bound to the request
 
         Returns
         -------
@@ -174,10 +274,13 @@ class BaseFormMixin(ContextMixin, TemplateMixin):
             Instantiated form
         """
 
-        if kls:
-            return kls(obj=obj, prefix=prefix)
+        kls = kls or self.get_form_class()
+
+        if self._options.prototype_forms:
+            from flask_velox.prototypes import instantiate
+            return instantiate(kls, obj=obj, prefix=prefix, **kwargs)
 
-        return self.get_form_class()(obj=obj, prefix=prefix)
+        return kls(obj=obj, prefix=prefix, **kwargs)
 
     def success_callback(self):
         """ Called on successful form validation, by default this will perform
@@ -190,7 +293,10 @@ class BaseFormMixin(ContextMixin, TemplateMixin):
             Redirects request to somewhere else
         """
 
-        raise RequestRedirect(self.redirect_url())
+        with phase('redirect'):
+            url = self.redirect_url()
+
+        raise RequestRedirect(url)
 
     def post(self, *args, **kwargs):
         """ Handle HTTP POST requets using Flask ``MethodView`` rendering a
@@ -226,6 +332,10 @@ class FormMixin(BaseFormMixin):
         An uninstantiated WTForm class
     """
 
+    _option_defaults = {
+        'form': None,
+    }
+
     def set_context(self):
         """ Overrides ``set_context`` to set extra context variables.
 
@@ -258,11 +368,12 @@ class FormMixin(BaseFormMixin):
             If ``form_class`` is not defined
         """
 
-        try:
-            return self.form
-        except AttributeError:
+        form = self._options.form
+        if form is None:
             raise NotImplementedError('``form`` must be defined')
 
+        return form
+
     def get_form(self):
         """ Returns an instantiated WTForm class.
 
@@ -276,7 +387,9 @@ class FormMixin(BaseFormMixin):
             return self._form
         except AttributeError:
             self._form = self.instantiate_form()
-            if self._form.validate_on_submit():
+            with phase('validate'):
+                valid = self._form.validate_on_submit()
+            if valid:
                 return self.success_callback()
             return self._form
 
@@ -303,6 +416,10 @@ class MultiFormMixin(BaseFormMixin):
 
     """
 
+    _option_defaults = {
+        'forms': None,
+    }
+
     def set_context(self):
         """ Updates context to contain extra variables.
 
@@ -338,11 +455,12 @@ class MultiFormMixin(BaseFormMixin):
             ``forms`` attribute is not defined
         """
 
-        try:
-            return self.forms
-        except AttributeError:
+        forms = self._options.forms
+        if forms is None:
             raise NotImplementedError('``forms`` must be defined.')
 
+        return forms
+
     def get_form(self):
         """ Get the submit form if one exists else return None, this allows
         us to get the correctly submit form to validate against and populate
@@ -363,9 +481,11 @@ class MultiFormMixin(BaseFormMixin):
         except AttributeError:
             forms = self.get_forms()
             submit_form = request.values.get('form')
-            name, form = forms.get(submit_form)
-            if form:
-                if form.validate_on_submit():
+            if submit_form in forms:
+                name, form = forms[submit_form]
+                with phase('validate'):
+                    valid = form.validate_on_submit()
+                if valid:
                     self.success_callback()
                 self._form = form
                 return form
@@ -391,7 +511,9 @@ class MultiFormMixin(BaseFormMixin):
 
         submit_form = request.values.get('form')
         if prefix == submit_form:
-            if form.validate_on_submit():
+            with phase('validate'):
+                valid = form.validate_on_submit()
+            if valid:
                 self._form = form
                 self.success_callback()
             return True
@@ -399,15 +521,20 @@ class MultiFormMixin(BaseFormMixin):
         return False
 
     def get_forms(self):
-        """ Instantiates forms set in ``forms`` attribute giving each form
-        an individual prefix and storing each form in a ``dict`` using its
-        prefix as the key.
+        """ Returns forms set in ``forms`` attribute giving each form an
+        individual prefix and storing each form in a ``dict`` like object
+        using its prefix as the key.
+
+        Only the submit form, identified by its prefix in the ``form``
+        request value, is bound to the request data and validated. Other
+        forms are instantiated unbound the first time they are accessed, for
+        example when the template renders them.
 
         Returns
         -------
-        collections.OrderedDict
-            Instantiated forms with form prefix as key and a tuple containing
-            the human readable form name and form object::
+        LazyForms
+            Forms with form prefix as key and a tuple containing the human
+            readable form name and form object::
 
                 {
                     'form1': ('Foo Form', <object>),
@@ -418,15 +545,24 @@ class MultiFormMixin(BaseFormMixin):
         try:
             return self._forms
         except AttributeError:
-            forms = OrderedDict()
+            forms = LazyForms()
+            submit_form = request.values.get('form')
             classes = self.get_form_classes()
             for i, values in enumerate(classes, start=1):
                 name, kls = values
                 prefix = 'form{0}'.format(i)
-                form = self.instantiate_form(
-                    kls=kls,
-                    prefix=prefix)
-                forms[prefix] = (name, form)
-                self.is_submit(form, prefix)
+                if prefix == submit_form:
+                    forms.add(prefix, name, self.instantiate_form(
+                        kls=kls,
+                        prefix=prefix))
+                else:
+                    forms.add_lazy(prefix, name, partial(
+                        self.instantiate_form,
+                        kls=kls,
+                        prefix=prefix,
+                        formdata=None))
             self._forms = forms
+            if submit_form in forms:
+                name, form = forms[submit_form]
+                self.is_submit(form, submit_form)
             return forms
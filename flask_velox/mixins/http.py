@@ -5,11 +5,14 @@ Flask ``View``.
 """
 
 from flask import url_for
+from flask._compat import with_metaclass
 from flask.views import View
+from flask_velox.instrumentation import phase
+from flask_velox.options import OptionsType
 from werkzeug.utils import redirect
 
 
-class RedirectMixin(View):
+class RedirectMixin(with_metaclass(OptionsType, View)):
     """ Raise a HTTP Redirect, by default a 302 HTTP Status Code will be used
     however this can be overridden using the ``code`` attribute.
 
@@ -34,6 +37,11 @@ class RedirectMixin(View):
 
     code = 302
 
+    _option_defaults = {
+        'rule': None,
+        'code': 302,
+    }
+
     def pre_dispatch(self, *args, **kwargs):
         """ If you wish to run an arbitrary piece of code before the
         redirect is dispatched you can override this method which is
@@ -51,9 +59,8 @@ class RedirectMixin(View):
             Generated url
         """
 
-        try:
-            rule = self.rule
-        except AttributeError:
+        rule = self._options.rule
+        if rule is None:
             raise NotImplementedError('``rule`` attr must be defined.')
 
         return url_for(rule)
@@ -68,4 +75,6 @@ class RedirectMixin(View):
         """
 
         self.pre_dispatch()
-        return redirect(self.get_url(), code=getattr(self, 'code', 302))
+
+        with phase('redirect'):
+            return redirect(self.get_url(), code=self._options.code)
@@ -10,6 +10,7 @@ The following packages must be installed:
 """
 
 from flask import flash, request
+from flask_velox.instrumentation import count, phase
 from flask_velox.mixins.template import TemplateMixin
 from flask_velox.mixins.context import ContextMixin
 from flask_velox.mixins.sqla.object import SingleObjectMixin
@@ -41,6 +42,10 @@ class DeleteObjectMixin(SingleObjectMixin, ContextMixin, TemplateMixin):
         defaults to ``True``
     """
 
+    _option_defaults = {
+        'confirm': True,
+    }
+
     def __init__(self, *args, **kwargs):
         """ Constructor. Invokes the object deletion process.
         """
@@ -62,7 +67,7 @@ class DeleteObjectMixin(SingleObjectMixin, ContextMixin, TemplateMixin):
             Ok to delete the object or not
         """
 
-        if getattr(self, 'confirm', True):
+        if self._options.confirm:
             return bool(request.args.get('confirm', False))
 
         return True
@@ -105,7 +110,10 @@ class DeleteObjectMixin(SingleObjectMixin, ContextMixin, TemplateMixin):
 
         self.flash()
 
-        raise RequestRedirect(self.redirect_url())
+        with phase('redirect'):
+            url = self.redirect_url()
+
+        raise RequestRedirect(url)
 
     def delete(self):
         """ Deletes the object, only if :py:meth:`can_delete` returns ``True``.
@@ -168,8 +176,11 @@ class MultiDeleteObjectMixin(DeleteObjectMixin):
             except AttributeError:
                 raise AttributeError('Lookup field does not exist')
 
-            for obj in model.query.filter(field.in_(vals)).all():
-                objects.add(obj)
+            with phase('get_objects'):
+                for obj in model.query.filter(field.in_(vals)).all():
+                    objects.add(obj)
+
+            count('rows', len(objects))
 
             self._objs = objects
             return objects
@@ -12,10 +12,15 @@ The following packages must be installed:
 """
 
 from flask import flash
+from flask_velox.instrumentation import phase
 from flask_velox.mixins.forms import FormMixin, MultiFormMixin
 from flask_velox.mixins.sqla.object import SingleObjectMixin
 
 
+#: Marks attributes the object does not have
+_missing = object()
+
+
 class BaseCreateUpdateMixin(object):
     """ Base Mixin for Creating or Updating a object with SQLAlchemy.
 
@@ -23,18 +28,29 @@ class BaseCreateUpdateMixin(object):
     -------
     This mixin cannot be used on it's own and should be used inconjunction
     with others, such as :py:class:`ModelFormMixin`.
+
+    Attributes
+    ----------
+    cache_choices : bool, optional
+        Cache the objects listed by ``QuerySelectField`` fields, see
+        :py:mod:`flask_velox.choices`, defaults to ``False``
     """
 
+    _option_defaults = {
+        'cache_choices': False,
+    }
+
     def success_callback(self):
         """ Overrides ``success_callback`` creating new model objects. This
         method is called on successful form validations. It first obtains
         the current db session and the instantiated form. A blank object
         is obtained from the model and then populated with the form data.
+        Existing objects are only saved when the form data changed them.
 
         .. literalinclude:: ../../../../flask_velox/mixins/sqla/forms.py
             :language: python
-            :emphasize-lines: 5
-            :lines: 49-56
+            :emphasize-lines: 4, 6
+            :lines: 65-75
 
         See Also
         --------
@@ -46,19 +62,145 @@ class BaseCreateUpdateMixin(object):
             Redirects request to somewhere else
         """
 
-        session = self.get_session()
         form = self.get_form()
         obj = self.get_object()
 
-        form.populate_obj(obj)
+        self.populate_obj(form, obj)
 
-        session.add(obj)
-        session.commit()
+        if self.is_modified(obj) and not self.save(obj):
+            return self.conflict_callback()
 
         self.flash()
 
         return super(BaseCreateUpdateMixin, self).success_callback()
 
+    def instantiate_form(self, *args, **kwargs):
+        """ Overrides form instantiation to replace the queries of
+        ``QuerySelectField`` fields with cached objects when
+        ``cache_choices`` is ``True``.
+
+        Returns
+        -------
+        object
+            Instantiated form
+        """
+
+        form = super(BaseCreateUpdateMixin, self).instantiate_form(
+            *args,
+            **kwargs)
+
+        if self._options.cache_choices:
+            from flask_velox.choices import cache_choices
+            cache_choices(form)
+
+        return form
+
+    def post(self, *args, **kwargs):
+        """ Overrides ``post`` to respond with a ``409`` status when the
+        object could not be saved due to a conflicting change.
+
+        Returns
+        -------
+        str or tuple
+            Rendered template or rendered template and status code
+        """
+
+        response = super(BaseCreateUpdateMixin, self).post(*args, **kwargs)
+
+        if getattr(self, '_conflict', False):
+            return response, 409
+
+        return response
+
+    def populate_obj(self, form, obj, exclude=()):
+        """ Populates an object with form data. Fields are only populated
+        when their data differs from the objects current attribute value so
+        unchanged columns are not written to.
+
+        Arguments
+        ---------
+        form : object
+            Validated form
+        obj : object
+            Model object to populate
+        exclude : tuple, optional
+            Names of fields not to populate
+        """
+
+        for name, field in form._fields.items():
+            if name in exclude:
+                continue
+            if getattr(obj, name, _missing) == field.data:
+                continue
+            field.populate_obj(obj, name)
+
+    def save(self, obj):
+        """ Adds the object to the session and commits.
+
+        Arguments
+        ---------
+        obj : object
+            Populated model object
+
+        Returns
+        -------
+        bool
+            Object was saved, False if it conflicts with a concurrent change
+        """
+
+        session = self.get_session()
+        session.add(obj)
+        session.commit()
+
+        return True
+
+    def conflict_callback(self):
+        """ Called when the object could not be saved because it was changed
+        by another request after the form was rendered. Flashes an error and
+        returns the form so it is rendered again with a ``409`` status.
+
+        Returns
+        -------
+        object
+            Submitted form
+        """
+
+        self._conflict = True
+
+        flash(
+            '{0} was changed by someone else, reload to see their '
+            'changes'.format(self.get_object()),
+            'error')
+
+        return self.get_form()
+
+    def is_modified(self, obj):
+        """ Returns if an object needs saving. New objects and objects not in
+        the views session are always saved, existing objects only when their
+        attributes have net changes.
+
+        Arguments
+        ---------
+        obj : object
+            Populated model object
+
+        Returns
+        -------
+        bool
+            Object should be added to the session and committed
+        """
+
+        from sqlalchemy import inspect
+
+        if not inspect(obj).persistent:
+            return True
+
+        session = self.get_session()
+        if obj not in session:
+            return True
+
+        return session.is_modified(obj)
+
 
 class CreateModelFormMixin(
         SingleObjectMixin,
@@ -66,14 +208,67 @@ class CreateModelFormMixin(
         FormMixin):
     """ Handles creating objects after form validation has completed and
     was successful.
+
+    Attributes
+    ----------
+    group_commit : bool, optional
+        Commit objects created by concurrent requests in a single
+        transaction, see :py:mod:`flask_velox.groupcommit`, defaults to
+        ``False``
     """
 
+    _option_defaults = {
+        'group_commit': False,
+    }
+
     def flash(self):
         """ Flash created message to user.
         """
 
         flash('Successfully created {0}'.format(self.get_object()), 'success')
 
+    def save(self, obj):
+        """ Overrides ``save`` to hand the object to a group committer when
+        ``group_commit`` is ``True``, waiting until it has been committed.
+        The object is removed from the views session while it is committed,
+        it may have been added by a relationship backref, and added back
+        once committed.
+
+        Arguments
+        ---------
+        obj : object
+            Populated model object
+
+        Returns
+        -------
+        bool
+            Object was saved
+        """
+
+        if not self._options.group_commit:
+            return super(CreateModelFormMixin, self).save(obj)
+
+        from flask_velox.groupcommit import get_committer
+        from sqlalchemy.orm import make_transient_to_detached, object_mapper
+
+        session = self.get_session()
+        bind = session.get_bind(mapper=object_mapper(obj))
+
+        if obj in session:
+            session.expunge(obj)
+
+        committer = get_committer(
+            bind,
+            getattr(session, 'session_factory', None))
+
+        with phase('group_commit'):
+            committer.submit(obj)
+
+        make_transient_to_detached(obj)
+        session.add(obj)
+
+        return True
+
 
 class UpdateModelFormMixin(
         SingleObjectMixin,
@@ -81,14 +276,105 @@ class UpdateModelFormMixin(
         FormMixin):
     """ Handels updating a single existing object after form validation has
     completed and was successful.
+
+    Example
+    -------
+
+    .. code-block:: python
+        :linenos:
+
+        from flask.ext.velox.mixins.sqla.forms import UpdateModelFormMixin
+        from flask.ext.wtf import Form
+        from wtforms import IntegerField
+        from wtforms.widgets import HiddenInput
+
+        class MyForm(Form):
+            version = IntegerField(widget=HiddenInput())
+
+        class MyView(UpdateModelFormMixin):
+            model = MyModel
+            form = MyForm
+            version_field = 'version'
+
+    Attributes
+    ----------
+    version_field : str, optional
+        Name of an integer column incremented on each save, enables
+        optimistic locking, the form must have a field of the same name
+        carrying the version the form was rendered with, defaults to None
     """
 
+    _option_defaults = {
+        'version_field': None,
+    }
+
     def flash(self):
         """ Flash updated message to user.
         """
 
         flash('Successfully updated {0}'.format(self.get_object()), 'success')
 
+    def get_version_field(self):
+        """ Returns the name of the version column used for optimistic
+        locking, or None if disabled.
+
+        Returns
+        -------
+        str or None
+            Version column name
+        """
+
+        return self._options.version_field
+
+    def populate_obj(self, form, obj, exclude=()):
+        """ Overrides ``populate_obj`` so the version column is never
+        populated from the form, it is incremented by :py:meth:`save`.
+        """
+
+        version_field = self.get_version_field()
+        if version_field is not None:
+            exclude = tuple(exclude) + (version_field, )
+
+        super(UpdateModelFormMixin, self).populate_obj(form, obj, exclude)
+
+    def save(self, obj):
+        """ Overrides ``save`` to increment the version column with an
+        ``UPDATE`` conditional on the version the form was rendered with
+        when ``version_field`` is defined. If another request saved the
+        object in the meantime no rows match, the transaction is rolled back
+        and the object is not saved.
+
+        Arguments
+        ---------
+        obj : object
+            Populated model object
+
+        Returns
+        -------
+        bool
+            Object was saved, False if it conflicts with a concurrent change
+        """
+
+        version_field = self.get_version_field()
+        if version_field is None:
+            return super(UpdateModelFormMixin, self).save(obj)
+
+        session = self.get_session()
+        model = self.get_model()
+        pk_field = self.get_pk_field()
+        version = getattr(model, version_field)
+
+        rows = session.query(model).filter(
+            getattr(model, pk_field) == getattr(obj, pk_field),
+            version == self.get_form()[version_field].data
+        ).update({version: version + 1}, synchronize_session=False)
+
+        if not rows:
+            session.rollback()
+            return False
+
+        return super(UpdateModelFormMixin, self).save(obj)
+
     def instantiate_form(self, **kwargs):
         """ Overrides form instantiation so object instance can be passed
         to the form.
@@ -96,7 +382,7 @@ class UpdateModelFormMixin(
         .. literalinclude:: ../../../../flask_velox/mixins/sqla/forms.py
             :language: python
             :emphasize-lines: 4
-            :lines: 112-116
+            :lines: 398-402
 
         See Also
         --------
@@ -10,6 +10,7 @@ The following packages must be installed:
 """
 
 from flask import request
+from flask_velox.instrumentation import count, phase
 from flask_velox.mixins.context import ContextMixin
 
 
@@ -26,6 +27,12 @@ class BaseModelMixin(ContextMixin):
         The primary key field name, defaults to ``id``
     """
 
+    _option_defaults = {
+        'model': None,
+        'session': None,
+        'pk_field': 'id',
+    }
+
     def set_context(self):
         """ Overrides ``set_context`` to set extra context variables.
 
@@ -58,10 +65,11 @@ class BaseModelMixin(ContextMixin):
 
         """
 
-        if not hasattr(self, 'session'):
+        session = self._options.session
+        if session is None:
             raise NotImplementedError('``session`` attribute required')
 
-        return self.session
+        return session
 
     def get_model(self):
         """ Returns the Model to perform queries against.
@@ -83,10 +91,11 @@ class BaseModelMixin(ContextMixin):
 
         """
 
-        if not hasattr(self, 'model'):
+        model = self._options.model
+        if model is None:
             raise NotImplementedError('``model`` attribute required')
 
-        return self.model
+        return model
 
     def get_pk_field(self):
         """ Returns the primary key field name. If ``pk_field`` is not
@@ -108,7 +117,7 @@ class BaseModelMixin(ContextMixin):
 
         """
 
-        return getattr(self, 'pk_field', 'id')
+        return self._options.pk_field
 
 
 class SingleObjectMixin(BaseModelMixin):
@@ -141,6 +150,10 @@ class SingleObjectMixin(BaseModelMixin):
             model = MyModel
     """
 
+    _option_defaults = {
+        'lookup_field': 'id',
+    }
+
     def get_lookup_field(self):
         """ Returns the field to lookup objects against, if ``lookup_field``
         is not defined ``id`` will be returned by default.
@@ -151,12 +164,13 @@ class SingleObjectMixin(BaseModelMixin):
             Field to use for lookup, defaults to ``id``
         """
 
-        return getattr(self, 'lookup_field', 'id')
+        return self._options.lookup_field
 
     def get_lookup_value(self):
         """ Attempt to get the value to use for looking up the object in
         the database, this is usually an id number but could technically
-        be anything.
+        be anything. Only ``None`` and empty strings are treated as missing,
+        so falsy values such as ``0`` are looked up.
 
         Returns
         -------
@@ -166,15 +180,17 @@ class SingleObjectMixin(BaseModelMixin):
 
         field = self.get_lookup_field()
 
-        # First check if view args contains the data
-        val = request.view_args.get(field)
+        # First check if view args contains the data, views which do not
+        # bind view args when created use the request's
+        view_args = getattr(self, '_view_args', None) or request.view_args
+        val = (view_args or {}).get(field)
 
-        if not val:
+        if val in (None, ''):
 
             # Second check if request.args has the data
             val = request.args.get(field)
 
-        if not val:
+        if val in (None, ''):
 
             # Third check if the instance has a attribute with the data
             val = getattr(self, field, None)
@@ -197,10 +213,12 @@ class SingleObjectMixin(BaseModelMixin):
         model = self.get_model()
         val = self.get_lookup_value()
 
-        if val:
+        if val not in (None, ''):
             filter_by = {
                 self.get_lookup_field(): val}
-            obj = model.query.filter_by(**filter_by).first()
+            with phase('get_object'):
+                obj = model.query.filter_by(**filter_by).first()
+            count('rows', int(obj is not None))
         else:
             obj = model()
 
@@ -27,10 +27,51 @@ Example
 
 """
 
+from collections import OrderedDict
 from flask import request
+from flask_velox.instrumentation import count, phase
 from flask_velox.mixins.sqla.object import BaseModelMixin, SingleObjectMixin
 
 
+#: Cache of human friendly column names keyed by model and column name
+_column_labels = {}
+
+
+def column_label(model, name):
+    """ Returns a human friendly name for a model column, see
+    :py:meth:`TableModelMixin.column_name`. Names are cached per model and
+    column as they can not change once the model is defined.
+
+    Arguments
+    ---------
+    model : class
+        SQLAlchemy model class
+    name : str
+        The column name mapping to a model field attribute
+
+    Returns
+    -------
+    str
+        Human friendly field name
+    """
+
+    try:
+        return _column_labels[(model, name)]
+    except KeyError:
+        pass
+
+    field = getattr(model, name)  # This could AttributeError
+
+    try:
+        label = field.info['label']
+    except (AttributeError, KeyError):
+        label = name.replace('_', ' ').title()
+
+    _column_labels[(model, name)] = label
+
+    return label
+
+
 class ListModelMixin(BaseModelMixin):
     """ Mixin provides ability to list multiple instances of a SQLAlchemy
     model.
@@ -64,8 +105,20 @@ class ListModelMixin(BaseModelMixin):
     per_page : int, optional
         If ``paginate`` is ``True`` customise the number of records to show
         per page, defaults to ``30``
+    facets : list, optional
+        A list of model field names to count rows against for each distinct
+        value, for example ``['status']``. Counts are calculated against the
+        base query so reflect any filtering applied to it.
     """
 
+    _option_defaults = {
+        'objects_context_name': 'objects',
+        'base_query': None,
+        'num_per_page': 30,
+        'paginate': True,
+        'facets': None,
+    }
+
     def set_context(self):
         """ Adds extra context to SQLAlchemy based list views.
 
@@ -79,6 +132,7 @@ class ListModelMixin(BaseModelMixin):
 
         * ``objects``: List of model objects
         * ``pagination``: Pagination object or ``None``
+        * ``facets``: Facet counts, see :py:meth:`get_facet_counts`
 
         Returns
         -------
@@ -92,6 +146,7 @@ class ListModelMixin(BaseModelMixin):
 
         self.add_context(self.get_objects_context_name(), objects)
         self.add_context('pagination', pagination)
+        self.add_context('facets', self.get_facet_counts())
 
     def get_objects_context_name(self):
         """ Returns the context name to use when returning the objects to
@@ -103,7 +158,7 @@ class ListModelMixin(BaseModelMixin):
             Name to use for context variable
         """
 
-        return getattr(self, 'objects_context_name', 'objects')
+        return self._options.objects_context_name
 
     def get_basequery(self):
         """ Returns SQLAlchemy base query object instance, if ``base_query`` is
@@ -118,8 +173,9 @@ class ListModelMixin(BaseModelMixin):
 
         """
 
-        model = self.get_model()
-        base_query = getattr(self, 'base_query', model.query)
+        base_query = self._options.base_query
+        if base_query is None:
+            return self.get_model().query
 
         return base_query
 
@@ -133,7 +189,7 @@ class ListModelMixin(BaseModelMixin):
             Number of records per page
         """
 
-        return getattr(self, 'num_per_page', 30)
+        return self._options.num_per_page
 
     def get_page(self):
         """ Attempt to get the current page number, assumes a HTTP GET
@@ -161,13 +217,85 @@ class ListModelMixin(BaseModelMixin):
 
         query = self.get_basequery()
 
-        if getattr(self, 'paginate', True):
-            page = self.get_page()
-            pagination = query.paginate(page, per_page=self.get_per_page())
+        with phase('get_objects'):
+            if self._options.paginate:
+                page = self.get_page()
+                pagination = query.paginate(
+                    page,
+                    per_page=self.get_per_page())
+                count('rows', len(pagination.items))
+
+                return pagination.items, pagination
+
+            objects = query.all()
+            count('rows', len(objects))
+
+            return objects, None
+
+    def get_facets(self):
+        """ Returns the list of field names to calculate facet counts for,
+        defaults to ``None``.
+
+        Returns
+        -------
+        list or None
+            Field names defined in ``facets``
+        """
+
+        return self._options.facets
+
+    def get_facet_counts(self):
+        """ Returns the number of rows for each distinct value of each field
+        defined in ``facets``. Each facet is counted in a single grouped query
+        against the base query rather than a count query per value, for
+        example::
 
-            return pagination.items, pagination
+            {% for value, count in facets.status.iteritems() %}
+                <li>{{ value }} ({{ count }})</li>
+            {% endfor %}
+
+        Returns
+        -------
+        collections.OrderedDict
+            Field name as key and an ``OrderedDict`` mapping each distinct
+            value to its row count as the value::
+
+                {
+                    'status': {'draft': 4, 'published': 12}
+                }
+
+        Raises
+        ------
+        AttributeError
+            If a facet field does not exist on the model
+        """
+
+        try:
+            return self._facet_counts
+        except AttributeError:
+            from sqlalchemy import func
 
-        return query.all(), None
+            counts = OrderedDict()
+            model = self.get_model()
+            query = self.get_basequery()
+
+            for name in self.get_facets() or []:
+                try:
+                    field = getattr(model, name)
+                except AttributeError:
+                    raise AttributeError(
+                        'Facet field {0} does not exist'.format(name))
+
+                rows = query.with_entities(field, func.count()) \
+                    .order_by(None) \
+                    .group_by(field) \
+                    .order_by(field) \
+                    .all()
+
+                counts[name] = OrderedDict(rows)
+
+            self._facet_counts = counts
+            return counts
 
 
 class TableModelMixin(ListModelMixin):
@@ -202,6 +330,11 @@ class TableModelMixin(ListModelMixin):
 
     """
 
+    _option_defaults = {
+        'columns': None,
+        'formatters': None,
+    }
+
     def set_context(self):
         """ Adds extra context to SQLAlchemy table based list views.
 
@@ -239,11 +372,12 @@ class TableModelMixin(ListModelMixin):
             If ``columns`` is not defined
         """
 
-        try:
-            return self.columns
-        except AttributeError:
+        columns = self._options.columns
+        if columns is None:
             raise NotImplementedError('``columns`` is not defined')
 
+        return columns
+
     def column_name(self, name):
         """ Attempts to get a human friendly  name for the column. First it
         will look for an ``info`` attribute on the model field, if present
@@ -270,15 +404,7 @@ class TableModelMixin(ListModelMixin):
             Human friendly field name
         """
 
-        model = self.get_model()
-        field = getattr(model, name)  # This could AttributeError
-
-        try:
-            name = field.info['label']
-        except (AttributeError, KeyError):
-            name = name.replace('_', ' ').title()
-
-        return name
+        return column_label(self.get_model(), name)
 
     def get_formatters(self):
         """ Return formatters defined for the View using this Mixin.
@@ -289,7 +415,7 @@ class TableModelMixin(ListModelMixin):
             Returns defined formatters or None
         """
 
-        return getattr(self, 'formatters', None)
+        return self._options.formatters
 
     def format_value(self, field, instance):
         """ Format a given field name and instance with defined formatter
@@ -338,6 +464,10 @@ class ObjectMixin(SingleObjectMixin):
     * :py:class:`flask_velox.mixins.sqla.object.SingleObjectMixin`
     """
 
+    _option_defaults = {
+        'object_context_name': 'object',
+    }
+
     def set_context(self):
         """ Set the context for a Object view.
 
@@ -366,4 +496,4 @@ class ObjectMixin(SingleObjectMixin):
             Context name to use for object in template
         """
 
-        return getattr(self, 'object_context_name', 'object')
+        return self._options.object_context_name
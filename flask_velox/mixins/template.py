@@ -24,11 +24,15 @@ Example
 
 """
 
-from flask import render_template, request
+from flask import has_request_context, render_template, request
+from flask._compat import with_metaclass
 from flask.views import MethodView
+from flask_velox import allocations
+from flask_velox.instrumentation import phase
+from flask_velox.options import MethodViewOptionsType
 
 
-class TemplateMixin(MethodView):
+class TemplateMixin(with_metaclass(MethodViewOptionsType, MethodView)):
     """ Renders a template on HTTP GET request as long as the ``template``
     attribute is defined.
 
@@ -48,30 +52,49 @@ class TemplateMixin(MethodView):
 
     """
 
-    def __getattr__(self, name):
-        """ Overriding this allows us to access request view args as attributes
-        on view instances.
+    _option_defaults = {
+        'template': None,
+    }
 
-        Returns
+    def __new__(cls, *args, **kwargs):
+        """ Binds request view args as attributes on view instances when the
+        view is created so they can be accessed in other methods, including
+        ``set_context`` which is called by the constructor. View args never
+        replace attributes defined on the class. The view args are also kept
+        in ``_view_args``.
+
+        Example
         -------
-        anything
-            Attribute value
 
-        Raises
-        ------
-        AttributeError
-            If attribute does not exist
+        .. code-block:: python
+            :linenos:
+
+            class MyView(TemplateMixin):
+                template = 'templates/user.html'
+
+                def get(self, *args, **kwargs):
+                    user = User.query.get(self.user_id)
+
+            app.add_url_rule(
+                '/user/<int:user_id>',
+                view_func=MyView.as_view('user'))
+
+        Returns
+        -------
+        object
+            View instance
         """
 
-        if not hasattr(self, '_view_args'):
-            self._view_args = request.view_args
+        self = super(TemplateMixin, cls).__new__(cls)
 
-        val = request.view_args.get(format(name))
+        view_args = request.view_args if has_request_context() else None
+        self._view_args = view_args = view_args or {}
 
-        if not val:
-            return super(TemplateMixin, self).__getattribute__(name)
+        for name, value in view_args.items():
+            if not hasattr(cls, name):
+                self.__dict__[name] = value
 
-        return val
+        return self
 
     @property
     def _template(self):
@@ -90,11 +113,12 @@ class TemplateMixin(MethodView):
 
         """
 
-        try:
-            return self.template
-        except AttributeError:
+        template = self._options.template
+        if template is None:
             raise NotImplementedError('template attribute is not defined')
 
+        return template
+
     def render(self):
         """ Renders a template. This method will attempt to pass context
         to the template but if the ``context`` attribute does not exist then
@@ -111,9 +135,10 @@ class TemplateMixin(MethodView):
         # context dict
         get_context = getattr(self, 'get_context', lambda: {})
 
-        return render_template(
-            self._template,
-            **get_context())
+        with phase('render'):
+            rendered = render_template(self._template, **get_context())
+            allocations.snapshot()
+            return rendered
 
     def get(self, *args, **kwargs):
         """ Handle HTTP GET requets using Flask ``MethodView`` rendering a
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+""" View options resolved once per class rather than on every request.
+
+Mixins declare the options they support and their defaults in an
+``_option_defaults`` dict. When a view class is created its options are
+resolved from the class attributes, falling back to the defaults declared by
+the mixins it inherits from, and stored in a read only object with
+``__slots__`` available as ``_options``. Accessors such as
+:py:meth:`flask_velox.mixins.sqla.read.ListModelMixin.get_per_page` then read
+a slot instead of looking up attributes and defaults on every call.
+
+Example
+-------
+
+.. code-block:: python
+    :linenos:
+
+    from flask.ext.velox.views.sqla.read import TableModelView
+    from yourapp.models import MyModel
+
+    class MyView(TableModelView):
+        model = MyModel
+        num_per_page = 50
+
+    MyView._options.num_per_page  # 50
+    MyView._options.paginate  # True
+
+Note
+----
+Options are class level configuration, instance attributes with the same
+names are not used and defining an option as a property raises a
+``TypeError`` when the class is created. To compute an option per request
+override its accessor method, for example ``get_per_page``. Options are
+resolved again when set on a class after it has been created but not for
+classes which already inherit from it.
+"""
+
+from flask.views import MethodViewType
+
+
+class Options(object):
+    """ Base class for read only view options, subclasses are created for
+    each view class with a slot for each option.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError('View options are read only')
+
+    def __repr__(self):
+        return '<{0} {1}>'.format(
+            self.__class__.__name__,
+            ', '.join(
+                '{0}={1!r}'.format(name, getattr(self, name))
+                for name in self.__slots__))
+
+
+def compile_options(cls):
+    """ Resolves the options of a view class.
+
+    Arguments
+    ---------
+    cls : class
+        View class
+
+    Returns
+    -------
+    Options
+        Read only options
+
+    Raises
+    ------
+    TypeError
+        If an option is defined as a property
+    """
+
+    defaults = {}
+    for base in reversed(cls.__mro__):
+        defaults.update(base.__dict__.get('_option_defaults', {}))
+
+    names = tuple(sorted(defaults))
+    kls = type(
+        '{0}Options'.format(cls.__name__),
+        (Options, ),
+        {'__slots__': names})
+
+    options = kls()
+    for name in names:
+        value = getattr(cls, name, defaults[name])
+        if isinstance(value, property):
+            raise TypeError(
+                '{0}.{1} is a view option and can not be a property, override '
+                'the method returning it to compute it per request'.format(
+                    cls.__name__,
+                    name))
+        object.__setattr__(options, name, value)
+
+    return options
+
+
+class OptionsType(type):
+    """ Metaclass resolving options when a view class is created.
+    """
+
+    def __init__(cls, name, bases, d):
+        super(OptionsType, cls).__init__(name, bases, d)
+
+        cls._options = compile_options(cls)
+
+    def __setattr__(cls, name, value):
+        super(OptionsType, cls).__setattr__(name, value)
+
+        options = cls.__dict__.get('_options')
+        if options is not None and name in options.__slots__:
+            cls._options = compile_options(cls)
+
+
+class MethodViewOptionsType(OptionsType, MethodViewType):
+    """ Metaclass resolving options for ``MethodView`` classes.
+    """
+
+    pass
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+
+""" On demand profiling of individual requests to ``Flask-Velox`` views.
+
+When ``VELOX_PROFILE_DIR`` is set a request carrying a valid signed
+``X-Velox-Profile`` header runs its view under a profiler and the profile is
+written to the directory, all other requests are unaffected. Tokens are
+signed with the application secret key, expire and can only be used once,
+generate one with :py:func:`make_token` or the ``flask velox profile-token``
+command:
+
+.. code-block:: bash
+
+    $ curl -H "X-Velox-Profile: $(flask velox profile-token)" \\
+        https://example.com/slow/page
+
+Profiles are written in the ``pstats`` format by ``cProfile``, view them with
+``python -m pstats`` or `snakeviz`_. When ``VELOX_PROFILER`` is
+``pyinstrument`` the `pyinstrument`_ sampling profiler is used instead and
+profiles are written in the `speedscope`_ format.
+
+Note
+----
+Used tokens are remembered by each process until they expire, when running
+multiple worker processes a token can be used once by each worker.
+
+Configuration
+-------------
+
+* ``VELOX_PROFILE_DIR``: Directory profiles are written to
+* ``VELOX_PROFILE_SECRET``: Secret used to sign tokens, defaults to the
+  application ``SECRET_KEY``
+* ``VELOX_PROFILE_MAX_AGE``: Seconds a token is valid for, defaults to
+  ``300``
+* ``VELOX_PROFILER``: ``cprofile`` or ``pyinstrument``, defaults to
+  ``cprofile``
+
+.. _snakeviz: https://jiffyclub.github.io/snakeviz/
+.. _pyinstrument: https://github.com/joerick/pyinstrument
+.. _speedscope: https://www.speedscope.app/
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+
+from flask import current_app, request
+from itsdangerous import BadSignature, TimestampSigner
+
+
+#: Header carrying the signed token
+HEADER = 'X-Velox-Profile'
+
+#: Logger profile paths are written to
+logger = logging.getLogger('flask_velox.profiling')
+
+
+class Profiler(object):
+    """ Validates profile tokens and runs views under a profiler.
+
+    Arguments
+    ---------
+    directory : str
+        Directory profiles are written to
+    secret : str
+        Secret used to sign tokens
+    max_age : int, optional
+        Seconds a token is valid for, defaults to ``300``
+    profiler : str, optional
+        ``cprofile`` or ``pyinstrument``, defaults to ``cprofile``
+    """
+
+    def __init__(self, directory, secret, max_age=300, profiler='cprofile'):
+        if profiler not in ('cprofile', 'pyinstrument'):
+            raise ValueError(
+                'VELOX_PROFILER must be cprofile or pyinstrument, '
+                'not {0}'.format(profiler))
+
+        self.directory = directory
+        self.signer = TimestampSigner(secret, salt='flask-velox-profile')
+        self.max_age = max_age
+        self.profiler = profiler
+        self.lock = threading.Lock()
+        self.used = {}
+
+    def make_token(self, endpoint='*'):
+        """ Returns a signed single use token for the ``X-Velox-Profile``
+        header.
+
+        Arguments
+        ---------
+        endpoint : str, optional
+            Endpoint the token is valid for, defaults to all endpoints
+
+        Returns
+        -------
+        str
+            Signed token
+        """
+
+        value = '{0}:{1}'.format(uuid.uuid4().hex, endpoint)
+        token = self.signer.sign(value.encode('utf-8'))
+
+        return token.decode('utf-8')
+
+    def use(self, token):
+        """ Marks a token as used, forgetting used tokens which have expired.
+
+        Arguments
+        ---------
+        token : str
+            Signed token
+
+        Returns
+        -------
+        bool
+            The token had not been used before
+        """
+
+        now = time.time()
+
+        with self.lock:
+            for used, expires in list(self.used.items()):
+                if expires < now:
+                    del self.used[used]
+            if token in self.used:
+                return False
+            self.used[token] = now + self.max_age
+            return True
+
+    def is_requested(self):
+        """ Returns if the current request carries a valid token for its
+        endpoint which has not been used before.
+
+        Returns
+        -------
+        bool
+            Request should be profiled
+        """
+
+        token = request.headers.get(HEADER)
+        if not token:
+            return False
+
+        try:
+            value = self.signer.unsign(
+                token.encode('utf-8'),
+                max_age=self.max_age).decode('utf-8')
+        except BadSignature:
+            logger.warning('Invalid %s header for %s', HEADER, request.path)
+            return False
+
+        nonce, separator, endpoint = value.partition(':')
+        if not separator or endpoint not in ('*', request.endpoint):
+            return False
+
+        if not self.use(token):
+            logger.warning('Used %s header for %s', HEADER, request.path)
+            return False
+
+        return True
+
+    def path(self, extension):
+        """ Returns a unique path in the profile directory for the current
+        request.
+        """
+
+        name = '{0}-{1}-{2}-{3}.{4}'.format(
+            request.endpoint,
+            time.strftime('%Y%m%d%H%M%S'),
+            os.getpid(),
+            uuid.uuid4().hex[:8],
+            extension)
+
+        return os.path.join(self.directory, name)
+
+    def run(self, view, *args, **kwargs):
+        """ Calls a view function under the configured profiler and writes
+        the profile, the profile is written even if the view raises.
+
+        Arguments
+        ---------
+        view : function
+            View function
+        \*args
+            Positional view arguments
+        \*\*kwargs
+            Keyword view arguments
+
+        Returns
+        -------
+        object
+            View return value
+        """
+
+        if self.profiler == 'pyinstrument':
+            return self.run_pyinstrument(view, *args, **kwargs)
+
+        return self.run_cprofile(view, *args, **kwargs)
+
+    def run_cprofile(self, view, *args, **kwargs):
+        """ Calls a view function under ``cProfile`` writing a ``pstats``
+        file.
+        """
+
+        import cProfile
+
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(view, *args, **kwargs)
+        finally:
+            path = self.path('pstats')
+            profile.dump_stats(path)
+            logger.info('Profile of %s written to %s', request.path, path)
+
+    def run_pyinstrument(self, view, *args, **kwargs):
+        """ Calls a view function under ``pyinstrument`` writing a
+        ``speedscope`` file.
+        """
+
+        from pyinstrument import Profiler as Sampler
+        from pyinstrument.renderers import SpeedscopeRenderer
+
+        sampler = Sampler()
+        sampler.start()
+        try:
+            return view(*args, **kwargs)
+        finally:
+            sampler.stop()
+            path = self.path('speedscope.json')
+            with open(path, 'w') as f:
+                f.write(sampler.output(renderer=SpeedscopeRenderer()))
+            logger.info('Profile of %s written to %s', request.path, path)
+
+
+def make_token(app=None, endpoint='*'):
+    """ Returns a signed single use token for the ``X-Velox-Profile``
+    header.
+
+    Arguments
+    ---------
+    app : object, optional
+        Flask application object, defaults to the current application
+    endpoint : str, optional
+        Endpoint the token is valid for, defaults to all endpoints
+
+    Returns
+    -------
+    str
+        Signed token
+    """
+
+    app = app or current_app
+
+    return app.extensions['velox_profiler'].make_token(endpoint)
+
+
+def init_app(app):
+    """ Enables on demand profiling for an application.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+
+    Raises
+    ------
+    ValueError
+        If neither ``VELOX_PROFILE_SECRET`` or ``SECRET_KEY`` is set
+    """
+
+    secret = app.config.get('VELOX_PROFILE_SECRET') or app.secret_key
+    if not secret:
+        raise ValueError(
+            'VELOX_PROFILE_SECRET or SECRET_KEY must be set to enable '
+            'profiling')
+
+    directory = app.config['VELOX_PROFILE_DIR']
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    profiler = Profiler(
+        directory,
+        secret,
+        max_age=app.config.get('VELOX_PROFILE_MAX_AGE', 300),
+        profiler=app.config.get('VELOX_PROFILER', 'cprofile'))
+
+    app.extensions['velox_profiler'] = profiler
+    app.extensions.setdefault('velox_view_runners', []).append(profiler)
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+""" Form prototypes for views serving the same form on many requests.
+
+Instantiating a WTForms form binds every field of the form class, creating
+field objects, labels and flags and copying choices. A prototype is an
+instance of a form class created once per process and prefix, each request
+then receives a shallow copy of the prototype and its fields with only per
+request state, such as submitted data, object data and the CSRF token,
+processed.
+
+Prototypes are used by :py:class:`flask_velox.mixins.forms.BaseFormMixin`
+when ``prototype_forms`` is ``True`` on the view class.
+
+Note
+----
+The following packages must be installed:
+
+* Flask-WTF
+
+Warning
+-------
+Fields are copied shallowly, only ``choices`` lists are copied for each
+request. Forms are built from their class when they contain ``FormField`` or
+``FieldList`` fields, when they override ``__init__`` or when instantiated
+with CSRF arguments, as copies of a prototype do not run the form's
+``__init__``.
+"""
+
+import copy
+import threading
+import werkzeug.datastructures
+
+from flask import current_app, request, session
+from flask_wtf import Form
+from wtforms.fields import FieldList, FormField
+
+
+#: Prototypes keyed by form class and prefix
+_prototypes = {}
+_lock = threading.Lock()
+
+#: Arguments which change how a form is built and prevent use of prototypes
+CSRF_ARGUMENTS = frozenset(['csrf_context', 'secret_key', 'csrf_enabled'])
+
+#: Marks formdata as not passed, the request data is used for submit forms
+AUTO = object()
+
+
+def is_cloneable(form):
+    """ Returns if a form can be used as a prototype. Only ``Flask-WTF``
+    forms are supported, forms overriding ``__init__`` are not as copies do
+    not run it and forms with fields containing other forms or fields can
+    not be copied shallowly.
+
+    Arguments
+    ---------
+    form : object
+        Instantiated form
+
+    Returns
+    -------
+    bool
+        Form can be used as a prototype
+    """
+
+    if not isinstance(form, Form):
+        return False
+
+    for kls in type(form).__mro__:
+        if kls is Form:
+            break
+        if '__init__' in kls.__dict__:
+            return False
+
+    return not any(
+        isinstance(field, (FormField, FieldList))
+        for field in form._fields.values())
+
+
+def get_prototype(kls, prefix=''):
+    """ Returns the prototype for a form class and prefix, creating it on
+    first use. Must be called within a request context.
+
+    Arguments
+    ---------
+    kls : class
+        Form class
+    prefix : str, optional
+        Form prefix
+
+    Returns
+    -------
+    object or None
+        Prototype form or None if the form can not be used as a prototype
+    """
+
+    key = (kls, prefix)
+
+    try:
+        return _prototypes[key]
+    except KeyError:
+        pass
+
+    with _lock:
+        if key not in _prototypes:
+            form = kls(formdata=None, prefix=prefix)
+            _prototypes[key] = form if is_cloneable(form) else None
+
+    return _prototypes[key]
+
+
+def get_formdata(form):
+    """ Returns the request data to bind a form to, as Flask-WTF does when
+    ``formdata`` is not passed to a form.
+    """
+
+    if not form.is_submitted():
+        return None
+
+    formdata = request.form
+    if request.files:
+        formdata = formdata.copy()
+        formdata.update(request.files)
+    elif request.json:
+        formdata = werkzeug.datastructures.MultiDict(request.json)
+
+    return formdata
+
+
+def copy_field(field):
+    """ Returns a shallow copy of a bound field. ``copy.copy`` can not be
+    used as WTForms ``Field.__new__`` returns an unbound field unless the
+    form and name are passed.
+
+    Arguments
+    ---------
+    field : object
+        Bound field
+
+    Returns
+    -------
+    object
+        Copied field
+    """
+
+    copied = object.__new__(field.__class__)
+    copied.__dict__.update(field.__dict__)
+
+    return copied
+
+
+def clone(prototype, formdata=AUTO, obj=None, **kwargs):
+    """ Returns a new form from a prototype processing per request state.
+
+    Arguments
+    ---------
+    prototype : object
+        Prototype form returned by :py:func:`get_prototype`
+    formdata : object, optional
+        Data to bind the form to, defaults to the request data when the
+        form is submitted
+    obj : object, optional
+        Object to populate the form with
+    \*\*kwargs
+        Field values passed to the forms ``process`` method
+
+    Returns
+    -------
+    object
+        Instantiated form
+    """
+
+    form = copy.copy(prototype)
+    form._errors = None
+    form._fields = {}
+
+    for name, field in prototype._fields.items():
+        field = copy_field(field)
+        if isinstance(getattr(field, 'choices', None), list):
+            field.choices = list(field.choices)
+        form._fields[name] = field
+        setattr(form, name, field)
+
+    form.csrf_enabled = current_app.config.get('WTF_CSRF_ENABLED', True)
+    if form.csrf_enabled:
+        form.SECRET_KEY = getattr(prototype.__class__, 'SECRET_KEY', None)
+    else:
+        form.SECRET_KEY = ''
+
+    if formdata is AUTO:
+        formdata = get_formdata(form)
+
+    form.process(formdata, obj, **kwargs)
+
+    form.csrf_token.current_token = form.generate_csrf_token(session)
+
+    return form
+
+
+def instantiate(kls, obj=None, prefix='', **kwargs):
+    """ Instantiates a form from its prototype, falling back to the form
+    class when the form can not be used as a prototype.
+
+    Arguments
+    ---------
+    kls : class
+        Form class
+    obj : object, optional
+        Object to populate the form with
+    prefix : str, optional
+        Form prefix
+    \*\*kwargs
+        Arbitrary keyword arguments passed to the form class
+
+    Returns
+    -------
+    object
+        Instantiated form
+    """
+
+    if CSRF_ARGUMENTS.intersection(kwargs):
+        return kls(obj=obj, prefix=prefix, **kwargs)
+
+    prototype = get_prototype(kls, prefix)
+    if prototype is None:
+        return kls(obj=obj, prefix=prefix, **kwargs)
+
+    return clone(prototype, obj=obj, **kwargs)
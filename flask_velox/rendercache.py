@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+""" Render cache for the markup of forms which are not bound to any data.
+
+A ``GET`` request to a form view renders the same empty form every time, only
+the CSRF token differs. When ``cache_form_markup`` is ``True`` on the view
+class the markup rendered by the ``form_fields`` macro in
+``velox/lib/forms.html`` for unbound forms is cached, keyed by form class,
+prefix and template, with the CSRF token replaced by a placeholder. Later
+requests splice their own token into the cached markup rather than running
+the field macros.
+
+Forms are only cached when no field has submitted data, errors or data other
+than its default, so forms populated from an object or with errors after a
+``POST`` are always rendered.
+
+Warning
+-------
+Only enable the cache for forms whose defaults, choices and labels are the
+same for every request. Fields with callable defaults are never cached.
+"""
+
+import os
+
+from binascii import hexlify
+from flask import Markup, escape
+from flask._compat import text_type
+
+
+#: Cached markup keyed by form class, prefix, template and CSRF use
+_markup = {}
+
+#: Replaces the CSRF token in cached markup, unique per process
+PLACEHOLDER = u'__velox_csrf_{0}__'.format(hexlify(os.urandom(8)).decode())
+
+
+def is_cacheable(form):
+    """ Returns if a form is rendered the same on every request, it is not
+    bound to request data, has no errors and all fields hold their defaults.
+
+    Arguments
+    ---------
+    form : object
+        Instantiated form
+
+    Returns
+    -------
+    bool
+        Form markup can be cached
+    """
+
+    for field in form:
+        if getattr(field, 'raw_data', None) is not None:
+            return False
+        if field.errors or field.process_errors:
+            return False
+        if field.object_data is not field.default:
+            return False
+
+    return True
+
+
+def form_fields(template, form, render):
+    """ Returns the markup for the fields of a form, rendered by ``render``
+    or from the cache if the form is cacheable.
+
+    Arguments
+    ---------
+    template : str
+        Template rendering the form
+    form : object
+        Instantiated form
+    render : callable
+        Renders the fields of a form, for example a Jinja macro
+
+    Returns
+    -------
+    jinja2.Markup
+        Form fields markup
+    """
+
+    if not is_cacheable(form):
+        return render(form)
+
+    csrf_token = getattr(form, 'csrf_token', None)
+    token = getattr(csrf_token, 'current_token', None)
+    key = (form.__class__, form._prefix, template, bool(token))
+
+    try:
+        html = _markup[key]
+    except KeyError:
+        html = text_type(render(form))
+        if token:
+            html = text_type.replace(html, escape(token), PLACEHOLDER)
+        _markup[key] = html
+
+    if token:
+        html = text_type.replace(html, PLACEHOLDER, escape(token))
+
+    return Markup(html)
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+""" Logging of slow SQL statements executed by ``Flask-Velox`` views when
+fetching objects, see :py:class:`flask_velox.mixins.sqla.read.ListModelMixin`,
+:py:class:`flask_velox.mixins.sqla.object.SingleObjectMixin` and
+:py:class:`flask_velox.mixins.sqla.delete.MultiDeleteObjectMixin`.
+
+When ``VELOX_SLOW_QUERY_THRESHOLD`` is set statements taking longer than the
+threshold are logged to the ``flask_velox.slowquery`` logger with the view
+class, the bound parameters and the query plan returned by the database, for
+example ``EXPLAIN QUERY PLAN`` on SQLite or ``EXPLAIN`` on PostgreSQL and
+MySQL.
+
+Configuration
+-------------
+
+* ``VELOX_SLOW_QUERY_THRESHOLD``: Milliseconds a statement must take to be
+  logged
+* ``VELOX_SLOW_QUERY_INTERVAL``: Minimum seconds between log entries,
+  defaults to ``10``. Slow statements within the interval are counted but not
+  explained or logged so a slow database is not put under further load
+"""
+
+import logging
+import threading
+import time
+
+from flask import current_app
+
+
+#: Logger slow statements are written to
+logger = logging.getLogger('flask_velox.slowquery')
+
+#: Phases in which statements are checked
+QUERY_PHASES = ('get_objects', 'get_object')
+
+#: Statement prefix used to obtain a query plan for each dialect
+EXPLAIN = {
+    'sqlite': 'EXPLAIN QUERY PLAN ',
+    'postgresql': 'EXPLAIN ',
+    'mysql': 'EXPLAIN ',
+}
+
+
+class RateLimit(object):
+    """ Allows one event per interval, counting events which were not
+    allowed.
+
+    Arguments
+    ---------
+    interval : float
+        Seconds between allowed events
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.allowed = 0
+        self.suppressed = 0
+
+    def allow(self):
+        """ Returns the number of events suppressed since the last allowed
+        event or ``None`` if this event is not allowed.
+
+        Returns
+        -------
+        int or None
+            Suppressed events
+        """
+
+        now = time.time()
+
+        with self.lock:
+            if now - self.allowed < self.interval:
+                self.suppressed += 1
+                return None
+            suppressed, self.suppressed = self.suppressed, 0
+            self.allowed = now
+            return suppressed
+
+
+def explain(conn, statement, parameters):
+    """ Returns the query plan for a statement. The plan is obtained on a
+    separate raw DBAPI connection from the engine's pool so the ``EXPLAIN``
+    statement is not itself instrumented and cannot commit, abort or
+    otherwise affect the transaction of the connection the statement was
+    executed on.
+
+    Arguments
+    ---------
+    conn : object
+        SQLAlchemy connection the statement was executed on
+    statement : str
+        SQL statement
+    parameters : tuple or dict
+        Bound parameters
+
+    Returns
+    -------
+    str or None
+        Query plan, one line per row, or None if the dialect is not
+        supported, the statement is not a ``SELECT`` or the engine's pool
+        shares a single connection
+    """
+
+    from sqlalchemy.pool import SingletonThreadPool, StaticPool
+
+    prefix = EXPLAIN.get(conn.dialect.name)
+    if prefix is None or not statement.lstrip().upper().startswith('SELECT'):
+        return None
+
+    engine = conn.engine
+    if isinstance(engine.pool, (SingletonThreadPool, StaticPool)):
+        return None
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+    except Exception as e:
+        return 'EXPLAIN failed: {0}'.format(e)
+    finally:
+        connection.close()
+
+    return '\n'.join(
+        ' | '.join(str(value) for value in row) for row in rows)
+
+
+def check(conn, statement, parameters, many, duration, phase, view):
+    """ Logs a statement if it took longer than ``VELOX_SLOW_QUERY_THRESHOLD``
+    and the rate limit allows. Called by
+    :py:func:`flask_velox.instrumentation.after_cursor_execute`.
+
+    Arguments
+    ---------
+    conn : object
+        SQLAlchemy connection the statement was executed on
+    statement : str
+        SQL statement
+    parameters : tuple or dict
+        Bound parameters
+    many : bool
+        Statement was executed with ``executemany``
+    duration : float
+        Time taken in milliseconds
+    phase : str
+        Phase the statement was executed in
+    view : str or None
+        View class name
+    """
+
+    state = current_app.extensions.get('velox_slow_queries')
+    if state is None or phase not in QUERY_PHASES:
+        return
+
+    threshold, limit = state
+    if duration < threshold:
+        return
+
+    suppressed = limit.allow()
+    if suppressed is None:
+        return
+
+    plan = None if many else explain(conn, statement, parameters)
+
+    logger.warning(
+        'Slow query in %s (%s) took %.1fms, %d slow queries not logged\n'
+        '%s\nParameters: %r\nPlan:\n%s',
+        view,
+        phase,
+        duration,
+        suppressed,
+        statement,
+        parameters,
+        plan)
+
+
+def init_app(app):
+    """ Enables slow query logging for an application.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+    """
+
+    app.extensions['velox_slow_queries'] = (
+        float(app.config['VELOX_SLOW_QUERY_THRESHOLD']),
+        RateLimit(app.config.get('VELOX_SLOW_QUERY_INTERVAL', 10)))
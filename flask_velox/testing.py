@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+""" Helpers for testing applications using ``Flask-Velox`` views.
+
+Note
+----
+The following packages must be installed:
+
+* SQLAlchemy
+"""
+
+import functools
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryBudget(object):
+    """ Counts SQL statements executed while a block of code runs, for example
+    dispatching a view through the Flask test client, and fails with an
+    ``AssertionError`` if more than ``budget`` statements were executed. Can
+    be used as a context manager or a decorator.
+
+    Only statements executed by the current thread are counted.
+
+    Example
+    -------
+
+    .. code-block:: python
+        :linenos:
+
+        from flask.ext.velox.testing import QueryBudget
+
+        def test_table_view_queries(client):
+            with QueryBudget(2):
+                client.get('/table?page=3')
+
+        @QueryBudget(1)
+        def test_object_view_queries(client):
+            client.get('/object/1')
+
+    Arguments
+    ---------
+    budget : int
+        Maximum number of statements allowed
+    engine : object, optional
+        SQLAlchemy engine to count statements for, defaults to all engines
+
+    Attributes
+    ----------
+    statements : list
+        Statements executed, populated when used as a context manager
+    """
+
+    def __init__(self, budget, engine=None):
+        """ Constructor
+
+        Arguments
+        ---------
+        budget : int
+            Maximum number of statements allowed
+        engine : object, optional
+            SQLAlchemy engine to count statements for, defaults to all
+            engines
+        """
+
+        self.budget = budget
+        self.engine = engine
+        self.statements = []
+
+    @property
+    def count(self):
+        """ Returns the number of statements executed.
+
+        Returns
+        -------
+        int
+            Number of statements
+        """
+
+        return len(self.statements)
+
+    def before_cursor_execute(
+            self,
+            conn,
+            cursor,
+            statement,
+            parameters,
+            context,
+            executemany):
+        """ SQLAlchemy event listener recording statements executed by the
+        thread which entered the budget.
+        """
+
+        if threading.current_thread() is self._thread:
+            self.statements.append(statement)
+
+    def __enter__(self):
+        self.statements = []
+        self._thread = threading.current_thread()
+
+        event.listen(
+            self.engine or Engine,
+            'before_cursor_execute',
+            self.before_cursor_execute)
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        event.remove(
+            self.engine or Engine,
+            'before_cursor_execute',
+            self.before_cursor_execute)
+
+        if exc_type is None and self.count > self.budget:
+            raise AssertionError(
+                '{0} queries executed, budget is {1}:\n{2}'.format(
+                    self.count,
+                    self.budget,
+                    '\n'.join(self.statements)))
+
+    def __call__(self, func):
+        """ Decorate a function so it runs within a new budget.
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with QueryBudget(self.budget, self.engine):
+                return func(*args, **kwargs)
+
+        return wrapper
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+""" Optional tracing of ``Flask-Velox`` request phases using the
+OpenTelemetry API. When ``VELOX_TRACING`` is ``True`` each phase recorded by
+:py:func:`flask_velox.instrumentation.phase` is wrapped in a span, for example
+a ``velox.dispatch`` span around each view with child spans for assembling
+context, fetching objects, each SQL statement, rendering templates and saving
+uploaded files.
+
+Spans of phases which raise an exception are given an error status unless
+the exception is an HTTP exception with a status code below ``500``, for
+example a ``404`` or a redirect raised by url routing.
+
+Note
+----
+The following packages must be installed:
+
+* opentelemetry-api
+* opentelemetry-sdk, only if using ``VELOX_TRACING_EXPORTER``
+
+Configuration
+-------------
+
+* ``VELOX_TRACING_EXPORTER``: Export spans for local use, either ``console``
+  to write spans to stdout or ``file`` to append spans to
+  ``VELOX_TRACING_FILE`` as JSON lines. When not set spans are sent to the
+  tracer provider configured by the application
+* ``VELOX_TRACING_FILE``: Path to write spans to when
+  ``VELOX_TRACING_EXPORTER`` is ``file``
+"""
+
+import atexit
+import os
+import sys
+from werkzeug.exceptions import HTTPException
+
+
+def is_error(error):
+    """ Returns if an exception raised within a span is an error. HTTP
+    exceptions with a status code below ``500``, such as ``404`` responses
+    and the redirects raised by url routing, are part of handling a request
+    rather than errors.
+
+    Arguments
+    ---------
+    error : Exception
+        Exception raised within the span
+
+    Returns
+    -------
+    bool
+        The exception is an error
+    """
+
+    if isinstance(error, HTTPException):
+        return error.code is None or error.code >= 500
+
+    return True
+
+
+def record_error(span, error):
+    """ Records an exception raised within a span, setting the span status
+    to error if :py:func:`is_error` returns ``True``.
+
+    Arguments
+    ---------
+    span : object
+        OpenTelemetry span
+    error : Exception
+        Exception raised within the span
+    """
+
+    if not is_error(error):
+        return
+
+    from opentelemetry.trace import Status, StatusCode
+
+    span.record_exception(error)
+    span.set_status(Status(StatusCode.ERROR, str(error)))
+
+
+def shutdown(provider, out):
+    """ ``atexit`` handler exporting remaining spans and closing the file
+    spans are written to.
+
+    Arguments
+    ---------
+    provider : object
+        OpenTelemetry tracer provider
+    out : file
+        File spans are written to
+    """
+
+    provider.shutdown()
+    out.close()
+
+
+def span_formatter(span):
+    """ Formats a span as a single line of JSON.
+    """
+
+    return span.to_json(indent=None) + os.linesep
+
+
+def init_exporter(app):
+    """ Sets a global tracer provider exporting spans to the console or a
+    file, see ``VELOX_TRACING_EXPORTER``.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+
+    Raises
+    ------
+    ValueError
+        If ``VELOX_TRACING_EXPORTER`` is not ``console`` or ``file``
+    """
+
+    exporter = app.config.get('VELOX_TRACING_EXPORTER')
+    if not exporter:
+        return
+
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        ConsoleSpanExporter,
+        SimpleSpanProcessor)
+
+    if exporter == 'console':
+        out = sys.stdout
+    elif exporter == 'file':
+        out = open(app.config['VELOX_TRACING_FILE'], 'a')
+    else:
+        raise ValueError(
+            'VELOX_TRACING_EXPORTER must be console or file, '
+            'not {0}'.format(exporter))
+
+    provider = TracerProvider(shutdown_on_exit=exporter != 'file')
+    provider.add_span_processor(SimpleSpanProcessor(
+        ConsoleSpanExporter(out=out, formatter=span_formatter)))
+    trace.set_tracer_provider(provider)
+
+    if exporter == 'file':
+        atexit.register(shutdown, provider, out)
+
+
+def init_app(app):
+    """ Enables tracing for an application, storing a tracer used by
+    :py:func:`flask_velox.instrumentation.phase`.
+
+    Arguments
+    ---------
+    app : object
+        Flask application object
+    """
+
+    from opentelemetry import trace
+
+    init_exporter(app)
+
+    app.extensions['velox_tracer'] = trace.get_tracer('flask_velox')
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+""" Helpers for building urls in templates which render many links to the
+same endpoint, for example an update link on every row of a table.
+
+Example
+-------
+
+.. code-block:: python
+    :linenos:
+
+    from flask.ext.velox.urls import UrlBuilder
+
+    update_url = UrlBuilder('.update')
+    for obj in objects:
+        update_url(id=obj.id)
+"""
+
+from flask import current_app, request, url_for
+
+
+class UrlBuilder(object):
+    """ Callable which generates urls for a Flask url rule with the same
+    signature as ``url_for``. The first call with a single keyword argument
+    builds the url using ``url_for`` and splits the result into a prefix and
+    suffix around the converted argument value. Subsequent calls with the same
+    single argument only run the rules converter and join the strings.
+
+    Any other call, for example with extra or different keyword arguments,
+    falls back to ``url_for``, as does a call with a value the converter
+    rejects so the error is raised and handled by ``url_for``.
+
+    Arguments
+    ---------
+    rule : str
+        Raw Flask url rule, e.g: ``.update``
+    """
+
+    def __init__(self, rule):
+        """ Constructor
+
+        Arguments
+        ---------
+        rule : str
+            Raw Flask url rule, e.g: ``.update``
+        """
+
+        self.rule = rule
+
+        #: Name of the argument the builder was compiled for
+        self._key = None
+
+        #: Set when the rule could not be compiled, prevents retrying
+        self._failed = False
+
+    def __call__(self, **kwargs):
+        """ Generate a url for the rule.
+
+        Arguments
+        ---------
+        \*\*kwargs
+            Arbitrary keyword arguments passed to ``Flask.url_for``
+
+        Returns
+        -------
+        str
+            Generated url
+        """
+
+        if self._key is not None and len(kwargs) == 1:
+            value = kwargs.get(self._key)
+            if value is not None:
+                try:
+                    return self._prefix + self._to_url(value) + self._suffix
+                except (TypeError, ValueError):
+                    pass
+
+        url = url_for(self.rule, **kwargs)
+
+        if self._key is None and not self._failed and len(kwargs) == 1:
+            self.compile(url, kwargs)
+
+        return url
+
+    def get_endpoint(self):
+        """ Returns the absolute endpoint for the rule, relative rules
+        starting with ``.`` are resolved against the current blueprint in the
+        same way as ``url_for``.
+
+        Returns
+        -------
+        str
+            Absolute endpoint name
+        """
+
+        if self.rule[:1] == '.':
+            if request.blueprint is not None:
+                return request.blueprint + self.rule
+            return self.rule[1:]
+
+        return self.rule
+
+    def compile(self, url, kwargs):
+        """ Splits a url generated by ``url_for`` into a prefix and suffix
+        around the converted value of the single keyword argument. If the
+        url can not be split unambiguously the builder will always use
+        ``url_for``.
+
+        Arguments
+        ---------
+        url : str
+            Url generated by ``url_for`` for ``kwargs``
+        kwargs : dict
+            The single keyword argument used to generate ``url``
+        """
+
+        key, value = list(kwargs.items())[0]
+        self._failed = True
+
+        if key.startswith('_') or value is None:
+            return
+
+        try:
+            rules = [
+                r for r in current_app.url_map.iter_rules(self.get_endpoint())
+                if key in r.arguments]
+        except KeyError:
+            return
+
+        # Only compile when exactly one rule can be built for the argument
+        # and it takes no other arguments or defaults
+        if not len(rules) == 1:
+            return
+
+        rule = rules[0]
+        if not rule.arguments == set([key]) or rule.defaults:
+            return
+
+        # The rule only has one argument so everything after it in the rule
+        # string is static
+        converter = getattr(rule, '_converters', {}).get(key)
+        if converter is None:
+            return
+
+        suffix = rule.rule[rule.rule.rindex('>') + 1:]
+        to_url = converter.to_url
+        try:
+            converted = to_url(value)
+        except (TypeError, ValueError):
+            return
+        if not url.endswith(converted + suffix):
+            return
+
+        self._prefix = url[:len(url) - len(converted + suffix)]
+        self._suffix = suffix
+        self._to_url = to_url
+        self._key = key
+        self._failed = False
@@ -85,6 +85,8 @@ setup(
         'develop': read_dependencies(DEV_DEPS)},
     # Dependencies not hosted on PyPi
     dependency_links=[],
+    # Tests
+    test_suite='nose.collector',
     # Classifiers for Package Indexing
     # Entry points, for example Flask-Script
     entry_points={},
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+""" Tests for ``Flask-Velox``.
+
+Run with ``python setup.py test`` or ``nosetests tests``.
+"""
+
+import os
+import tempfile
+import unittest
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from jinja2 import DictLoader
+
+
+db = SQLAlchemy()
+
+
+class Parent(db.Model):
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(64))
+
+    def __repr__(self):
+        return '<Parent {0}>'.format(self.name)
+
+
+class Child(db.Model):
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(64))
+    status = db.Column(db.String(16), default='draft')
+    version = db.Column(db.Integer, nullable=False, default=1)
+    parent_id = db.Column(db.Integer, db.ForeignKey('parent.id'))
+    parent = db.relationship(Parent, backref='children')
+
+    def __repr__(self):
+        return '<Child {0}>'.format(self.name)
+
+
+class VeloxTestCase(unittest.TestCase):
+    """ Creates an application with a SQLite database file, shared by the
+    committer thread of group commit tests, and an application context.
+
+    Attributes
+    ----------
+    templates : dict
+        Templates available to the application by name
+    """
+
+    templates = {}
+
+    def setUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+
+        self.app = Flask(__name__)
+        self.app.config.update({
+            'TESTING': True,
+            'SECRET_KEY': 'secret',
+            'WTF_CSRF_ENABLED': False,
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///{0}'.format(self.db_path),
+        })
+        self.app.jinja_loader = DictLoader(self.templates)
+
+        db.init_app(self.app)
+
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        os.remove(self.db_path)
+
+    def add(self, *objs):
+        """ Adds and commits objects returning the first.
+        """
+
+        db.session.add_all(objs)
+        db.session.commit()
+
+        return objs[0]
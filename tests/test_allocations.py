@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from flask_velox import instrumentation
+from flask_velox.views.template import TemplateView
+from tests import VeloxTestCase
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+@unittest.skipIf(tracemalloc is None, 'tracemalloc requires Python 3.4+')
+class AllocationTracerTest(VeloxTestCase):
+
+    templates = {
+        'home.html': '{{ data|length }}',
+    }
+
+    def setUp(self):
+        super(AllocationTracerTest, self).setUp()
+
+        class HomeView(TemplateView):
+            template = 'home.html'
+
+            def set_context(self):
+                super(HomeView, self).set_context()
+                self.add_context('data', bytearray(1024 * 1024))
+
+        self.app.config['VELOX_ALLOCATIONS'] = True
+        self.app.add_url_rule('/', view_func=HomeView.as_view('home'))
+        instrumentation.init_app(self.app)
+
+    def test_context_held_while_rendering_is_reported(self):
+        self.client.get('/')
+
+        report = self.app.extensions['velox_allocations'].reports['home']
+
+        self.assertGreaterEqual(report['current'], 1024 * 1024)
+        self.assertIn(__file__.rstrip('c'), report['top'][0]['site'])
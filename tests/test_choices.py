@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+from flask_velox import choices
+from flask_velox.testing import QueryBudget
+from flask_wtf import Form
+from tests import Parent, VeloxTestCase, db
+from wtforms.ext.sqlalchemy.fields import QuerySelectField
+
+
+class ParentForm(Form):
+    parent = QuerySelectField(
+        query_factory=lambda: Parent.query,
+        get_label='name')
+
+
+class ChoicesTest(VeloxTestCase):
+
+    def setUp(self):
+        super(ChoicesTest, self).setUp()
+
+        choices._choices.clear()
+        choices.listen_writes()
+        self.add(Parent(name='a'))
+
+    def tearDown(self):
+        choices._choices.clear()
+        super(ChoicesTest, self).tearDown()
+
+    def test_cached_objects_are_not_queried(self):
+        choices.get_objects(Parent.query)
+
+        with QueryBudget(0):
+            objects = choices.get_objects(Parent.query)
+
+        self.assertEqual([obj.name for obj in objects], ['a'])
+        self.assertTrue(all(obj in db.session for obj in objects))
+
+    def test_commits_invalidate_cached_objects(self):
+        choices.get_objects(Parent.query)
+        self.add(Parent(name='b'))
+
+        with QueryBudget(1) as budget:
+            objects = choices.get_objects(Parent.query)
+
+        self.assertEqual(budget.count, 1)
+        self.assertEqual(
+            sorted(obj.name for obj in objects),
+            ['a', 'b'])
+
+    def test_expired_objects_are_queried(self):
+        choices.get_objects(Parent.query, ttl=-1)
+
+        with QueryBudget(1) as budget:
+            choices.get_objects(Parent.query)
+
+        self.assertEqual(budget.count, 1)
+
+    def test_form_choices_use_cached_objects(self):
+        choices.get_objects(Parent.query)
+
+        with self.app.test_request_context('/'):
+            form = ParentForm()
+            choices.cache_choices(form)
+
+            with QueryBudget(0):
+                labels = [label for _, label, _ in form.parent.iter_choices()]
+
+        self.assertEqual(labels, ['a'])
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from flask_velox.mixins import context
+from flask_velox.views.template import TemplateView
+from tests import VeloxTestCase
+
+
+class DashboardView(TemplateView):
+    template = 'dashboard.html'
+    context_timeout = 5
+    context_providers = {
+        'thread': 'get_thread',
+        'failed': 'fail',
+    }
+
+    def get_thread(self):
+        return threading.current_thread()
+
+    def fail(self):
+        raise ValueError()
+
+
+class ContextProvidersTest(VeloxTestCase):
+
+    def test_options(self):
+        self.assertEqual(DashboardView._options.context_timeout, 5)
+        self.assertEqual(
+            DashboardView._options.context_providers,
+            DashboardView.context_providers)
+
+    def test_providers_run_on_pool(self):
+        with self.app.test_request_context('/'):
+            view = DashboardView()
+
+        self.assertIsNot(
+            view.get_context()['thread'],
+            threading.current_thread())
+        self.assertIsNone(view.get_context()['failed'])
+
+    def test_providers_run_inline_when_pool_is_busy(self):
+        with self.app.test_request_context('/'):
+            context.get_pool()
+            acquired = 0
+            while context._slots.acquire(False):
+                acquired += 1
+            try:
+                view = DashboardView()
+            finally:
+                for _ in range(acquired):
+                    context._slots.release()
+
+        self.assertIs(view.get_context()['thread'], threading.current_thread())
+        self.assertIsNone(view.get_context()['failed'])
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from flask_velox.mixins.forms import LazyForms
+from flask_velox.views.forms import MultiFormView
+from flask_wtf import Form
+from tests import VeloxTestCase
+from wtforms import TextField, validators
+
+
+class NameForm(Form):
+    name = TextField(validators=[validators.Required()])
+
+
+class LazyFormsTest(unittest.TestCase):
+
+    def test_factories_called_once_on_first_access(self):
+        calls = []
+        forms = LazyForms()
+        forms.add('form1', 'Built', 'built')
+        forms.add_lazy('form2', 'Lazy', lambda: calls.append(1) or 'lazy')
+
+        self.assertEqual(list(forms), ['form1', 'form2'])
+        self.assertEqual(calls, [])
+        self.assertEqual(forms['form2'], ('Lazy', 'lazy'))
+        self.assertEqual(forms['form2'], ('Lazy', 'lazy'))
+        self.assertEqual(calls, [1])
+        self.assertEqual(forms['form1'], ('Built', 'built'))
+
+
+class MultiFormMixinTest(VeloxTestCase):
+
+    def setUp(self):
+        super(MultiFormMixinTest, self).setUp()
+
+        self.built = built = []
+
+        class NamesView(MultiFormView):
+            template = 'forms.html'
+            forms = [
+                ('First', NameForm),
+                ('Second', NameForm),
+            ]
+
+            def instantiate_form(self, **kwargs):
+                built.append(kwargs['prefix'])
+                return super(NamesView, self).instantiate_form(**kwargs)
+
+        self.view = NamesView
+        self.app.add_url_rule('/', view_func=NamesView.as_view('names'))
+
+    def test_only_submitted_form_is_bound(self):
+        data = {'form': 'form2', 'form2-name': ''}
+        with self.app.test_request_context('/', method='POST', data=data):
+            view = self.view()
+            form = view.get_form()
+
+            self.assertEqual(self.built, ['form2'])
+            self.assertIn('name', form.errors)
+            self.assertFalse(view.get_forms()['form1'][1].errors)
+            self.assertEqual(self.built, ['form2', 'form1'])
+
+    def test_no_submitted_form(self):
+        with self.app.test_request_context('/'):
+            view = self.view()
+
+            self.assertIsNone(view.get_form())
+            self.assertEqual(self.built, [])
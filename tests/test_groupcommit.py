@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from flask import Flask, has_app_context
+from flask_velox.groupcommit import GroupCommitter, get_committer
+from flask_velox.views.sqla.forms import CreateModelView
+from flask_wtf import Form
+from sqlalchemy import event
+from tests import Child, Parent, VeloxTestCase, db
+from wtforms import TextField
+from wtforms.ext.sqlalchemy.fields import QuerySelectField
+
+
+class ChildForm(Form):
+    name = TextField()
+    parent = QuerySelectField(query_factory=lambda: Parent.query)
+
+
+class GroupCommitTest(VeloxTestCase):
+
+    templates = {
+        'form.html': '{{ form.name.data }}',
+    }
+
+    def setUp(self):
+        super(GroupCommitTest, self).setUp()
+
+        self.parent = self.add(Parent(name='p'))
+
+        class CreateView(CreateModelView):
+            template = 'form.html'
+            model = Child
+            session = db.session
+            form = ChildForm
+            redirect_url_rule = 'list'
+            group_commit = True
+
+        self.app.add_url_rule('/', 'list', lambda: '')
+        self.app.add_url_rule(
+            '/create',
+            view_func=CreateView.as_view('create'))
+
+    def test_creates_object_related_to_request_session_object(self):
+        response = self.client.post('/create', data={
+            'name': 'c',
+            'parent': self.parent.id,
+        })
+
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(
+            db.session.query(Child.name, Child.parent_id).all(),
+            [('c', self.parent.id)])
+
+    def test_commits_in_application_context(self):
+        contexts = []
+
+        def before_insert(mapper, connection, target):
+            contexts.append(has_app_context())
+
+        event.listen(Child, 'before_insert', before_insert)
+        try:
+            self.client.post('/create', data={
+                'name': 'c',
+                'parent': self.parent.id,
+            })
+        finally:
+            event.remove(Child, 'before_insert', before_insert)
+
+        self.assertEqual(contexts, [True])
+
+
+class BrokenApp(object):
+
+    def app_context(self):
+        raise RuntimeError('no context')
+
+
+class GroupCommitterTest(VeloxTestCase):
+
+    def test_app_context_errors_are_raised_in_requests(self):
+        committer = GroupCommitter(db.engine, app=BrokenApp(), timeout=5)
+
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                committer.submit(Child(name='c'))
+
+        self.assertTrue(committer.thread.is_alive())
+
+    def test_submit_times_out(self):
+        release = threading.Event()
+
+        class SlowCommitter(GroupCommitter):
+            def insert(self, objs):
+                release.wait(5)
+
+        committer = SlowCommitter(db.engine, timeout=0.05)
+        try:
+            with self.assertRaises(RuntimeError):
+                committer.submit(Child(name='c'))
+        finally:
+            release.set()
+
+    def test_committers_are_per_application(self):
+        engine = db.engine
+        other = Flask(__name__)
+
+        with other.app_context():
+            theirs = get_committer(engine)
+
+        self.assertIsNot(get_committer(engine), theirs)
+        self.assertIs(get_committer(engine), get_committer(engine))
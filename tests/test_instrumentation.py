@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+from flask_velox import instrumentation
+from flask_velox.instrumentation import get_timings, phase
+from flask_velox.views.template import TemplateView
+from sqlalchemy.exc import OperationalError
+from tests import VeloxTestCase, db
+
+
+class PhaseTest(VeloxTestCase):
+
+    def setUp(self):
+        super(PhaseTest, self).setUp()
+
+        self.app.config['VELOX_SERVER_TIMING'] = True
+        instrumentation.init_app(self.app)
+
+    def test_phases_exclude_nested_time(self):
+        with self.app.test_request_context():
+            with phase('context'):
+                with phase('get_objects'):
+                    time.sleep(0.05)
+
+            timings = get_timings()
+
+        self.assertGreaterEqual(timings['get_objects'][0], 50)
+        self.assertLess(timings['context'][0], 25)
+
+    def test_sql_excluded_from_enclosing_phase(self):
+        ticks = iter([0.0, 0.01, 0.02, 0.03])
+        timer = instrumentation.default_timer
+        instrumentation.default_timer = lambda: next(ticks)
+
+        try:
+            with self.app.test_request_context():
+                with phase('get_objects'):
+                    db.session.execute('SELECT 1')
+
+                timings = get_timings()
+        finally:
+            instrumentation.default_timer = timer
+
+        self.assertAlmostEqual(timings['sql'][0], 10)
+        self.assertAlmostEqual(timings['get_objects'][0], 20)
+
+    def test_failed_statements_are_popped(self):
+        with db.engine.connect() as conn:
+            with self.assertRaises(OperationalError):
+                conn.execute('SELECT * FROM missing')
+
+            self.assertFalse(conn.info.get('velox_query_start'))
+
+
+class InstrumentViewsTest(VeloxTestCase):
+
+    templates = {
+        'home.html': 'home',
+    }
+
+    def setUp(self):
+        super(InstrumentViewsTest, self).setUp()
+
+        class HomeView(TemplateView):
+            template = 'home.html'
+
+        self.view = HomeView.as_view('home')
+        self.app.add_url_rule('/', view_func=self.view)
+
+    def test_views_not_wrapped_when_disabled(self):
+        instrumentation.init_app(self.app)
+        self.client.get('/')
+
+        self.assertIs(self.app.view_functions['home'], self.view)
+
+    def test_views_wrapped_when_enabled(self):
+        self.app.config['VELOX_SERVER_TIMING'] = True
+        instrumentation.init_app(self.app)
+        response = self.client.get('/')
+
+        self.assertIsNot(self.app.view_functions['home'], self.view)
+        self.assertIn('dispatch;dur=', response.headers['Server-Timing'])
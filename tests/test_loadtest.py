@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from flask_velox import loadtest
+
+
+class PercentileTest(unittest.TestCase):
+
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+
+        self.assertEqual(loadtest.percentile(values, 50), 50)
+        self.assertEqual(loadtest.percentile(values, 99), 99)
+
+    def test_no_values(self):
+        self.assertIsNone(loadtest.percentile([], 95))
+
+
+class ReportTest(unittest.TestCase):
+
+    def test_reports_targets_without_requests(self):
+        lines = loadtest.report([{
+            'target': 'GET list',
+            'requests': 0,
+            'errors': 0,
+            'throughput': 0.0,
+            'p50': None,
+            'p95': None,
+            'p99': None,
+        }])
+
+        self.assertEqual(lines[1].split()[-3:], ['-', '-', '-'])
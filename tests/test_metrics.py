@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+from flask_velox import instrumentation
+from tests import VeloxTestCase
+
+
+class MetricsEndpointTest(VeloxTestCase):
+
+    def init_metrics(self, **config):
+        self.app.config['VELOX_METRICS'] = True
+        self.app.config.update(config)
+        instrumentation.init_app(self.app)
+
+    def test_not_exposed_by_default(self):
+        self.init_metrics()
+
+        self.assertEqual(self.client.get('/metrics').status_code, 404)
+
+    def test_exposed_on_configured_url(self):
+        self.init_metrics(VELOX_METRICS_URL='/metrics')
+
+        response = self.client.get('/metrics')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/plain')
+
+    def test_token_required(self):
+        self.init_metrics(
+            VELOX_METRICS_URL='/metrics',
+            VELOX_METRICS_TOKEN='secret')
+
+        self.assertEqual(self.client.get('/metrics').status_code, 401)
+        self.assertEqual(self.client.get('/metrics', headers={
+            'Authorization': 'Bearer wrong'}).status_code, 401)
+        self.assertEqual(self.client.get('/metrics', headers={
+            'Authorization': 'Bearer secret'}).status_code, 200)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+from flask_velox.mixins.sqla.object import SingleObjectMixin
+from flask_velox.views.template import TemplateView
+from tests import Child, VeloxTestCase
+
+
+class LookupView(SingleObjectMixin):
+    model = Child
+
+
+class SingleObjectMixinTest(VeloxTestCase):
+
+    def setUp(self):
+        super(SingleObjectMixinTest, self).setUp()
+
+        self.child = self.add(Child(name='a'))
+        self.app.add_url_rule('/<int:id>', 'object', lambda id: '')
+        self.app.add_url_rule('/', 'list', lambda: '')
+
+    def test_view_args_without_template_mixin(self):
+        with self.app.test_request_context('/{0}'.format(self.child.id)):
+            self.assertEqual(LookupView().get_object(), self.child)
+
+    def test_query_string(self):
+        path = '/?id={0}'.format(self.child.id)
+        with self.app.test_request_context(path):
+            self.assertEqual(LookupView().get_object(), self.child)
+
+    def test_zero_lookup_value(self):
+        zero = self.add(Child(id=0, name='zero'))
+
+        with self.app.test_request_context('/0'):
+            self.assertEqual(LookupView().get_object(), zero)
+
+        with self.app.test_request_context('/?id=0'):
+            self.assertEqual(LookupView().get_object(), zero)
+
+    def test_view_args_take_precedence_over_query_string(self):
+        self.add(Child(id=0, name='zero'))
+
+        path = '/0?id={0}'.format(self.child.id)
+        with self.app.test_request_context(path):
+            self.assertEqual(LookupView().get_object().id, 0)
+
+    def test_empty_lookup_value_returns_blank_object(self):
+        with self.app.test_request_context('/?id='):
+            obj = LookupView().get_object()
+
+        self.assertIsNone(obj.id)
+
+
+class ViewArgsTest(VeloxTestCase):
+
+    def test_falsy_view_args_are_bound(self):
+        class PageView(TemplateView):
+            template = 'page.html'
+
+        self.app.add_url_rule('/<int:page>', 'page', lambda page: '')
+
+        with self.app.test_request_context('/0'):
+            view = PageView()
+
+        self.assertEqual(view.page, 0)
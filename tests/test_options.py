@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from flask_velox.mixins.http import RedirectMixin
+from flask_velox.mixins.sqla.object import BaseModelMixin
+from tests import Parent
+
+
+class CompileOptionsTest(unittest.TestCase):
+
+    def test_defaults_and_class_attributes(self):
+        class View(RedirectMixin):
+            rule = 'home'
+
+        self.assertEqual(View._options.rule, 'home')
+        self.assertEqual(View._options.code, 302)
+
+    def test_subclasses_inherit_options(self):
+        class View(RedirectMixin):
+            rule = 'home'
+
+        class MovedView(View):
+            code = 301
+
+        self.assertEqual(MovedView._options.rule, 'home')
+        self.assertEqual(MovedView._options.code, 301)
+
+    def test_options_set_after_creation_are_resolved(self):
+        class View(RedirectMixin):
+            rule = 'home'
+
+        View.rule = 'other'
+
+        self.assertEqual(View._options.rule, 'other')
+
+    def test_options_are_read_only(self):
+        with self.assertRaises(AttributeError):
+            RedirectMixin._options.code = 301
+
+    def test_property_options_are_rejected(self):
+        with self.assertRaises(TypeError):
+            class View(RedirectMixin):
+                @property
+                def rule(self):
+                    return 'home'
+
+    def test_mixins_without_a_view_class(self):
+        class View(BaseModelMixin):
+            model = Parent
+            pk_field = 'uuid'
+
+        self.assertEqual(View().get_pk_field(), 'uuid')
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+from flask import has_request_context
+from flask_velox import Velox
+from flask_velox.views.forms import FormView
+from flask_velox.views.sqla.read import ObjectView
+from flask_wtf import Form
+from jinja2 import DictLoader
+from tests import Child, VeloxTestCase, db
+
+
+class RecordingLoader(DictLoader):
+
+    def __init__(self, mapping):
+        super(RecordingLoader, self).__init__(mapping)
+        self.loaded = []
+
+    def get_source(self, environment, template):
+        self.loaded.append(template)
+        return super(RecordingLoader, self).get_source(environment, template)
+
+
+class PreloadTest(VeloxTestCase):
+
+    templates = {
+        'object.html': '{{ object.name }}',
+        'form.html': '{{ form }}',
+    }
+
+    def setUp(self):
+        super(PreloadTest, self).setUp()
+
+        self.app.jinja_loader = RecordingLoader(self.templates)
+
+        class DetailView(ObjectView):
+            template = 'object.html'
+            model = Child
+            session = db.session
+
+        class EditView(FormView):
+            template = 'form.html'
+            form = Form
+            submit_url_rule = 'detail'
+            redirect_url_rule = 'edit'
+
+        self.app.add_url_rule(
+            '/<int:id>',
+            view_func=DetailView.as_view('detail'))
+        self.app.add_url_rule('/edit', view_func=EditView.as_view('edit'))
+
+    def test_compiles_templates(self):
+        Velox().preload(self.app)
+
+        self.assertEqual(
+            sorted(self.app.jinja_loader.loaded),
+            ['form.html', 'object.html'])
+
+    def test_preload_view_outside_request_context(self):
+        velox = Velox()
+
+        for kls in velox.get_view_classes(self.app):
+            velox.preload_view(self.app, kls)
+
+        self.assertFalse(has_request_context())
+        self.assertEqual(
+            sorted(self.app.jinja_loader.loaded),
+            ['form.html', 'object.html'])
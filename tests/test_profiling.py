@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+import shutil
+import tempfile
+import unittest
+
+from flask import Flask
+from flask_velox.profiling import HEADER, Profiler
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.profiler = Profiler(self.directory, 'secret')
+        self.app = Flask(__name__)
+        self.app.add_url_rule('/', 'home', lambda: '')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def is_requested(self, token):
+        headers = {HEADER: token}
+        with self.app.test_request_context('/', headers=headers):
+            return self.profiler.is_requested()
+
+    def test_tokens_are_single_use(self):
+        token = self.profiler.make_token()
+
+        self.assertTrue(self.is_requested(token))
+        self.assertFalse(self.is_requested(token))
+
+    def test_tokens_are_unique(self):
+        self.assertNotEqual(
+            self.profiler.make_token(),
+            self.profiler.make_token())
+
+    def test_tokens_for_other_endpoints_are_not_used(self):
+        self.assertFalse(self.is_requested(self.profiler.make_token('other')))
+
+    def test_paths_are_unique(self):
+        with self.app.test_request_context('/'):
+            self.assertNotEqual(
+                self.profiler.path('pstats'),
+                self.profiler.path('pstats'))
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+from flask_velox import prototypes
+from flask_wtf import Form
+from tests import VeloxTestCase
+from wtforms import TextField
+
+
+class NameForm(Form):
+    name = TextField()
+
+
+class CustomInitForm(NameForm):
+
+    def __init__(self, *args, **kwargs):
+        super(CustomInitForm, self).__init__(*args, **kwargs)
+        self.name.label.text = 'Full name'
+
+
+class PrototypesTest(VeloxTestCase):
+
+    def test_clones_bind_submitted_data(self):
+        data = {'name': 'a'}
+        with self.app.test_request_context('/', method='POST', data=data):
+            form = prototypes.instantiate(NameForm)
+            prototype = prototypes.get_prototype(NameForm)
+
+        self.assertIsInstance(prototype, NameForm)
+        self.assertIsNot(form.name, prototype.name)
+        self.assertEqual(form.name.data, 'a')
+        self.assertIsNone(prototype.name.data)
+
+    def test_forms_overriding_init_are_not_cloned(self):
+        with self.app.test_request_context('/'):
+            self.assertIsNone(prototypes.get_prototype(CustomInitForm))
+
+            form = prototypes.instantiate(CustomInitForm)
+
+        self.assertEqual(form.name.label.text, 'Full name')
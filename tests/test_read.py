@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+from flask_velox.testing import QueryBudget
+from flask_velox.views.sqla.read import ModelListView
+from tests import Child, VeloxTestCase, db
+
+
+class FacetsTest(VeloxTestCase):
+
+    templates = {
+        'list.html': (
+            '{% for name, values in facets.items() %}'
+            '{{ name }}:{% for value, count in values.items() %}'
+            '{{ value }}={{ count }},{% endfor %}{% endfor %}'),
+    }
+
+    def setUp(self):
+        super(FacetsTest, self).setUp()
+
+        self.add(
+            Child(name='a', status='draft'),
+            Child(name='b', status='draft'),
+            Child(name='c', status='published'))
+
+        class ListView(ModelListView):
+            template = 'list.html'
+            model = Child
+            session = db.session
+            paginate = False
+            facets = ['status']
+
+        self.app.add_url_rule('/', view_func=ListView.as_view('list'))
+
+    def test_counts_each_value(self):
+        response = self.client.get('/')
+
+        self.assertEqual(
+            response.data.decode('utf-8'),
+            'status:draft=2,published=1,')
+
+    def test_single_query_per_facet(self):
+        with QueryBudget(2):
+            self.client.get('/')
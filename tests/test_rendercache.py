@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import re
+
+from flask_velox import Velox, rendercache
+from flask_velox.rendercache import PLACEHOLDER, form_fields
+from flask_velox.views.forms import FormView
+from flask_wtf import Form
+from tests import VeloxTestCase
+from wtforms import TextField, validators
+
+
+class NameForm(Form):
+    name = TextField(validators=[validators.Required()])
+
+
+class OtherForm(Form):
+    other = TextField()
+
+
+def token_of(html):
+    return re.search(r'name="csrf_token" type="hidden" value="([^"]+)"',
+                     html).group(1)
+
+
+class RenderCacheTest(VeloxTestCase):
+
+    templates = {
+        'form.html': (
+            "{% import 'velox/lib/forms.html' as forms with context %}"
+            "{{ forms.form_fields(form) }}"),
+    }
+
+    def setUp(self):
+        super(RenderCacheTest, self).setUp()
+
+        self.app.config['WTF_CSRF_ENABLED'] = True
+        Velox().init_app(self.app)
+
+        self.rendered = []
+        rendercache._markup.clear()
+
+        class NameView(FormView):
+            template = 'form.html'
+            form = NameForm
+            redirect_url_rule = 'name'
+            cache_form_markup = True
+
+        class UncachedView(NameView):
+            cache_form_markup = False
+
+        self.app.add_url_rule('/', view_func=NameView.as_view('name'))
+        self.app.add_url_rule(
+            '/uncached',
+            view_func=UncachedView.as_view('uncached'))
+
+    def tearDown(self):
+        rendercache._markup.clear()
+
+        super(RenderCacheTest, self).tearDown()
+
+    def render(self, form):
+        self.rendered.append(form)
+        return u'<form>{0}</form>'.format(form.hidden_tag())
+
+    def test_second_render_hits_cache(self):
+        with self.app.test_request_context():
+            first = form_fields('form.html', NameForm(), self.render)
+            second = form_fields('form.html', NameForm(), self.render)
+
+        self.assertEqual(len(self.rendered), 1)
+        self.assertEqual(first, second)
+
+    def test_each_request_gets_its_own_csrf_token(self):
+        tokens = []
+        for i in range(2):
+            with self.app.test_request_context():
+                form = NameForm()
+                html = form_fields('form.html', form, self.render)
+                tokens.append(form.csrf_token.current_token)
+
+                self.assertEqual(token_of(html), tokens[-1])
+                self.assertNotIn(PLACEHOLDER, html)
+
+        self.assertEqual(len(self.rendered), 1)
+        self.assertNotEqual(tokens[0], tokens[1])
+
+    def test_cached_markup_matches_rendered_markup(self):
+        self.client.get('/')
+        cached = self.client.get('/').data.decode('utf-8')
+        uncached = self.client.get('/uncached').data.decode('utf-8')
+
+        self.assertEqual(len(rendercache._markup), 1)
+        self.assertEqual(
+            cached.replace(token_of(cached), ''),
+            uncached.replace(token_of(uncached), ''))
+
+    def test_cached_csrf_token_validates_per_session(self):
+        other = self.app.test_client()
+        token = token_of(self.client.get('/').data.decode('utf-8'))
+        other_token = token_of(other.get('/').data.decode('utf-8'))
+
+        self.assertNotEqual(token, other_token)
+        self.assertEqual(len(rendercache._markup), 1)
+
+        data = {'name': 'Name', 'csrf_token': other_token}
+        self.assertEqual(self.client.post('/', data=data).status_code, 200)
+        self.assertEqual(other.post('/', data=data).status_code, 301)
+
+    def test_bound_form_bypasses_cache(self):
+        data = {'name': 'Name'}
+        for i in range(2):
+            with self.app.test_request_context(
+                    '/', method='POST', data=data):
+                form_fields('form.html', NameForm(), self.render)
+
+        self.assertEqual(len(self.rendered), 2)
+        self.assertEqual(rendercache._markup, {})
+
+    def test_form_with_errors_bypasses_cache(self):
+        for i in range(2):
+            with self.app.test_request_context():
+                form = NameForm(formdata=None)
+                form.validate()
+                self.assertTrue(form.name.errors)
+
+                form_fields('form.html', form, self.render)
+
+        self.assertEqual(len(self.rendered), 2)
+        self.assertEqual(rendercache._markup, {})
+
+    def test_key_varies_by_template_and_form_class(self):
+        calls = [
+            ('form.html', NameForm),
+            ('other.html', NameForm),
+            ('form.html', OtherForm),
+        ]
+
+        rendered = []
+
+        with self.app.test_request_context():
+            for template, kls in calls * 2:
+                form_fields(
+                    template,
+                    kls(),
+                    lambda form: rendered.append((template, kls)) or u'')
+
+        self.assertEqual(rendered, calls)
+        self.assertEqual(len(rendercache._markup), 3)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+from flask_velox.slowquery import explain
+from tests import Child, VeloxTestCase, db
+
+
+class ExplainTest(VeloxTestCase):
+
+    def test_plan_for_select(self):
+        conn = db.session.connection()
+        plan = explain(conn, 'SELECT * FROM child WHERE name = ?', ('a', ))
+
+        self.assertIn('child', plan.lower())
+
+    def test_other_statements_not_explained(self):
+        conn = db.session.connection()
+
+        self.assertIsNone(explain(conn, 'DELETE FROM child', ()))
+
+    def test_transaction_not_affected(self):
+        db.session.add(Child(name='a'))
+        db.session.flush()
+
+        explain(db.session.connection(), 'SELECT * FROM child', ())
+        db.session.rollback()
+
+        self.assertEqual(Child.query.count(), 0)
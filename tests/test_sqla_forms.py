@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+from flask_velox.testing import QueryBudget
+from flask_velox.views.sqla.forms import UpdateModelFormView
+from flask_wtf import Form
+from tests import Child, VeloxTestCase, db
+from wtforms import IntegerField, TextField
+
+
+class ChildForm(Form):
+    name = TextField()
+    status = TextField()
+
+
+class VersionedChildForm(ChildForm):
+    version = IntegerField()
+
+
+def updates(statements):
+    return [s for s in statements if s.lstrip().upper().startswith('UPDATE')]
+
+
+class UpdateTest(VeloxTestCase):
+
+    templates = {
+        'form.html': '{{ form.name.data }}',
+    }
+
+    def setUp(self):
+        super(UpdateTest, self).setUp()
+
+        self.child = self.add(Child(name='a', status='draft'))
+
+        class UpdateView(UpdateModelFormView):
+            template = 'form.html'
+            model = Child
+            session = db.session
+            form = ChildForm
+            redirect_url_rule = 'list'
+
+        self.app.add_url_rule('/', 'list', lambda: '')
+        self.app.add_url_rule(
+            '/<int:id>',
+            view_func=UpdateView.as_view('update'))
+
+    def post(self, **data):
+        return self.client.post('/{0}'.format(self.child.id), data=data)
+
+    def test_unchanged_submission_is_not_saved(self):
+        with QueryBudget(10) as budget:
+            response = self.post(name='a', status='draft')
+
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(updates(budget.statements), [])
+
+    def test_only_changed_columns_are_written(self):
+        with QueryBudget(10) as budget:
+            self.post(name='b', status='draft')
+
+        statements = updates(budget.statements)
+
+        self.assertEqual(len(statements), 1)
+        self.assertIn('name', statements[0])
+        self.assertNotIn('status', statements[0])
+        self.assertEqual(db.session.query(Child.name).scalar(), 'b')
+
+
+class VersionTest(VeloxTestCase):
+
+    templates = {
+        'form.html': '{{ form.name.data }}',
+    }
+
+    def setUp(self):
+        super(VersionTest, self).setUp()
+
+        self.child = self.add(Child(name='a', status='draft'))
+
+        class UpdateView(UpdateModelFormView):
+            template = 'form.html'
+            model = Child
+            session = db.session
+            form = VersionedChildForm
+            redirect_url_rule = 'list'
+            version_field = 'version'
+
+        self.app.add_url_rule('/', 'list', lambda: '')
+        self.app.add_url_rule(
+            '/<int:id>',
+            view_func=UpdateView.as_view('update'))
+
+    def post(self, **data):
+        return self.client.post('/{0}'.format(self.child.id), data=data)
+
+    def test_save_increments_version(self):
+        response = self.post(name='b', status='draft', version=1)
+
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(
+            db.session.query(Child.name, Child.version).one(),
+            ('b', 2))
+
+    def test_conflicting_save_is_rejected(self):
+        db.session.query(Child).update({Child.version: 2})
+        db.session.commit()
+
+        response = self.post(name='b', status='draft', version=1)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(
+            db.session.query(Child.name, Child.version).one(),
+            ('a', 2))
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from flask_velox.tracing import is_error
+from werkzeug.exceptions import InternalServerError, NotFound
+from werkzeug.routing import RequestRedirect
+
+
+class IsErrorTest(unittest.TestCase):
+
+    def test_client_errors_and_redirects_are_not_errors(self):
+        self.assertFalse(is_error(NotFound()))
+        self.assertFalse(is_error(RequestRedirect('http://localhost/')))
+
+    def test_server_errors_and_exceptions_are_errors(self):
+        self.assertTrue(is_error(InternalServerError()))
+        self.assertTrue(is_error(ValueError()))
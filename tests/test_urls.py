@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+from flask import Blueprint, url_for
+from flask_velox import urls
+from flask_velox.urls import UrlBuilder
+from tests import VeloxTestCase
+
+
+def view(**kwargs):
+    return ''
+
+
+class UrlBuilderTest(VeloxTestCase):
+
+    def setUp(self):
+        super(UrlBuilderTest, self).setUp()
+
+        self.app.add_url_rule('/', 'index', view)
+        self.app.add_url_rule('/<int:id>/update/', 'update', view)
+        self.app.add_url_rule('/<name>', 'name', view)
+
+        bp = Blueprint('admin', __name__, url_prefix='/admin')
+        bp.add_url_rule('/', 'index', view)
+        bp.add_url_rule('/<int:id>/delete', 'delete', view)
+        self.app.register_blueprint(bp)
+
+    def assertBuilds(self, builder, *calls):
+        for kwargs in calls:
+            self.assertEqual(
+                builder(**kwargs),
+                url_for(builder.rule, **kwargs))
+
+    def test_static_rule(self):
+        with self.app.test_request_context():
+            self.assertBuilds(UrlBuilder('index'), {}, {})
+
+    def test_converter_rule(self):
+        builder = UrlBuilder('update')
+
+        with self.app.test_request_context():
+            self.assertBuilds(builder, {'id': 1}, {'id': 2}, {'id': 0})
+            self.assertEqual(builder._key, 'id')
+
+    def test_quoted_values(self):
+        with self.app.test_request_context():
+            self.assertBuilds(
+                UrlBuilder('name'),
+                {'name': 'a'},
+                {'name': u'a b/ü'})
+
+    def test_extra_query_args(self):
+        with self.app.test_request_context():
+            self.assertBuilds(
+                UrlBuilder('update'),
+                {'id': 1},
+                {'id': 2, 'page': 3},
+                {'id': 3})
+
+    def test_external(self):
+        with self.app.test_request_context():
+            self.assertBuilds(
+                UrlBuilder('update'),
+                {'id': 1},
+                {'id': 2, '_external': True},
+                {'_external': True, 'id': 3})
+
+    def test_blueprint_relative_endpoint(self):
+        builder = UrlBuilder('.delete')
+
+        with self.app.test_request_context('/admin/'):
+            self.assertBuilds(builder, {'id': 1}, {'id': 2})
+            self.assertEqual(builder(id=3), '/admin/3/delete')
+
+    def test_rejected_value_falls_back_to_url_for(self):
+        builder = UrlBuilder('update')
+        calls = []
+
+        def record(endpoint, **values):
+            calls.append(values)
+            return url_for(endpoint, **values)
+
+        with self.app.test_request_context():
+            builder(id=1)
+
+            urls.url_for = record
+            try:
+                with self.assertRaises(ValueError):
+                    builder(id='abc')
+            finally:
+                urls.url_for = url_for
+
+        self.assertEqual(calls, [{'id': 'abc'}])